@@ -1,79 +1,214 @@
+import asyncio
+import functools
+import inspect
+import logging
 import os
+import socket
+import sys
+from pathlib import Path
 
+import httpx
 from agno.storage.sqlite import SqliteStorage
 from dotenv import load_dotenv
+from prompt_toolkit import PromptSession
+from rich.console import Console
+from sqlalchemy import event
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
+from openai import AsyncOpenAI
 from agendo.sdk.googlecalendar import GoogleCalendarTools
 from agendo.tools.Scheduler import Scheduler
 from agendo.config.prompt import AGENT_CONFIG
 
-load_dotenv()
-
-db_file = r"E:\Projects\AgenDo\data\database\agent.db"
-
-# Simplified - disable memory for now to avoid getting stuck
-storage = SqliteStorage(table_name="agent_storage", db_file=db_file)
-
-# Initialize Google Calendar tools first
-calendar_tools = GoogleCalendarTools(
-    credentials_path=r"E:\Projects\AgenDo\agendo\config\credentials\credentials.json",
-    token_path=r"E:\Projects\AgenDo\agendo\config\credentials\token.json"
-)
-
-# Create the high-level Scheduler tool
-scheduler = Scheduler(calendar_tools=calendar_tools)
-
-print("📋 Available Scheduler methods:")
-for method_name in dir(scheduler):
-    if not method_name.startswith('_') and callable(getattr(scheduler, method_name)):
-        print(f"  - {method_name}")
-
-# TEST: Use GoogleCalendarTools directly to see if it works
-print("\n📋 Available GoogleCalendarTools methods:")
-for method_name in dir(calendar_tools):
-    if not method_name.startswith('_') and callable(getattr(calendar_tools, method_name)):
-        print(f"  - {method_name}")
-
-agent = Agent(
-    name=AGENT_CONFIG["name"],
-    model=OpenAIChat(
-        id="gpt-4o-mini",
-        api_key=os.getenv("OPENAI_API_KEY")
-    ),
-    tools=[scheduler],  # TEMPORARILY USE GOOGLECALENDARTOOLS DIRECTLY
-    description=AGENT_CONFIG["description"],
-    instructions=AGENT_CONFIG["instructions"],
-    session_id="agent_session",
-    storage=storage,
-    markdown=True,
-    show_tool_calls=True,
-    add_history_to_messages=True,
-    num_history_responses=10,
-    # Disabled memory features to prevent getting stuck
-    enable_agentic_memory=False,
-    enable_user_memories=False,
-    debug_mode=True,
-    reasoning=False
-)
-
-# Debug: Check what tools the agent actually has
-print("\n🔧 Agent Tools Debug:")
-if hasattr(agent, 'tools') and agent.tools:
-    for i, tool in enumerate(agent.tools):
-        print(f"Tool {i}: {type(tool).__name__}")
-        if hasattr(tool, '__dict__'):
-            print(f"  Methods: {[m for m in dir(tool) if not m.startswith('_') and callable(getattr(tool, m))]}")
-
-
-
-while True:
-    user_input = input("\nYou: ").strip()
-
-    if user_input.lower() in ['quit', 'exit']:
-        print("\n👋 Goodbye!")
-        print("📝 Your conversation is saved!")
-        break
-
-    if user_input:
-        agent.print_response(user_input)
\ No newline at end of file
+# Paths are resolved once, relative to the checkout, so they work on any machine
+ROOT = Path(__file__).resolve().parent.parent
+CREDENTIALS_DIR = ROOT / "agendo" / "config" / "credentials"
+
+db_file = str(ROOT / "data" / "database" / "agent.db")
+credentials_path = str(CREDENTIALS_DIR / "credentials.json")
+token_path = str(CREDENTIALS_DIR / "token.json")
+
+# The .env sits at the checkout root; naming it skips find_dotenv's walk up the directory tree
+load_dotenv(ROOT / ".env")
+
+# Environment settings are read once; the process never changes them
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# AGENDO_DEBUG=1 turns on Agno's tool-call tracing and the introspection listings.
+# It costs a few ms per tool call (argument repr + extra stdout writes).
+DEBUG = os.getenv("AGENDO_DEBUG") == "1"
+
+logger = logging.getLogger("agendo")
+if DEBUG:
+    logger.setLevel(logging.DEBUG)
+
+
+def _buffered_stdout():
+    # A block-buffered handle on stdout: Rich flushes once per render instead of
+    # the console issuing a write per line.
+    try:
+        return open(sys.stdout.fileno(), "w", encoding="utf-8", closefd=False)
+    except (AttributeError, OSError, ValueError):
+        return sys.stdout
+
+
+console = Console(file=_buffered_stdout(), highlight=False, soft_wrap=True)
+
+
+def _public_methods(obj) -> list:
+    """Public callables of obj, looked up statically so no descriptor or lazy loader fires."""
+    methods = obj.__dict__.get("_public_methods")
+    if methods is None:
+        methods = [m for m in dir(obj) if not m.startswith('_') and callable(inspect.getattr_static(obj, m, None))]
+        obj._public_methods = methods
+    return methods
+
+
+# Every heavy component is built on first use instead of at import time, so the
+# REPL prompt shows up without waiting on SQLite, Google auth or OpenAI setup.
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL + NORMAL drop the journal rename and half the fsyncs per history write;
+    # the engine's pool keeps this connection open across turns.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+@functools.lru_cache(maxsize=1)
+def get_storage() -> SqliteStorage:
+    # Simplified - disable memory for now to avoid getting stuck
+    storage = SqliteStorage(table_name="agent_storage", db_file=db_file)
+    event.listen(storage.db_engine, "connect", _set_sqlite_pragmas)
+    # SqliteStorage already opened a connection while inspecting the schema
+    storage.db_engine.dispose()
+    return storage
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    # One keep-alive HTTP/2 pool for every OpenAI request; without it Agno's async
+    # path creates a fresh client (and TLS handshake) per model call.
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_calendar_tools() -> GoogleCalendarTools:
+    calendar_tools = GoogleCalendarTools(
+        credentials_path=credentials_path,
+        token_path=token_path
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        console.print("\n📋 Available GoogleCalendarTools methods:")
+        for method_name in _public_methods(calendar_tools):
+            console.print(f"  - {method_name}")
+
+    return calendar_tools
+
+
+@functools.lru_cache(maxsize=1)
+def get_scheduler() -> Scheduler:
+    # Create the high-level Scheduler tool
+    scheduler = Scheduler(calendar_tools=get_calendar_tools())
+
+    if logger.isEnabledFor(logging.DEBUG):
+        console.print("📋 Available Scheduler methods:")
+        for method_name in _public_methods(scheduler):
+            console.print(f"  - {method_name}")
+
+    return scheduler
+
+
+@functools.lru_cache(maxsize=1)
+def get_agent() -> Agent:
+    # Agno builds the tool JSON schemas once per Agent and caches them, so keeping a
+    # single agent for the process means the Scheduler is introspected only once.
+    agent = Agent(
+        name=AGENT_CONFIG["name"],
+        model=OpenAIChat(
+            id="gpt-4o-mini",
+            api_key=OPENAI_API_KEY,
+            async_client=AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=get_http_client())
+        ),
+        tools=[get_scheduler()],  # TEMPORARILY USE GOOGLECALENDARTOOLS DIRECTLY
+        description=AGENT_CONFIG["description"],
+        instructions=AGENT_CONFIG["instructions"],
+        session_id="agent_session",
+        storage=get_storage(),
+        markdown=True,
+        show_tool_calls=DEBUG,
+        add_history_to_messages=True,
+        # Only the last few turns are replayed into the prompt; older ones stay in storage
+        num_history_responses=3,
+        # Disabled memory features to prevent getting stuck
+        enable_agentic_memory=False,
+        enable_user_memories=False,
+        debug_mode=DEBUG,
+        reasoning=False
+    )
+
+    # Debug: Check what tools the agent actually has
+    if logger.isEnabledFor(logging.DEBUG) and agent.tools:
+        console.print("\n🔧 Agent Tools Debug:")
+        for i, tool in enumerate(agent.tools):
+            console.print(f"Tool {i}: {type(tool).__name__}")
+            if hasattr(tool, '__dict__'):
+                console.print(f"  Methods: {_public_methods(tool)}")
+
+    return agent
+
+
+async def _prewarm():
+    # Runs while the user types the first message: opens the pooled TLS connection
+    # to OpenAI and resolves the Google API host, so the first turn skips both.
+    try:
+        await get_http_client().head(
+            "https://api.openai.com/v1/models",
+            headers={"Authorization": f"Bearer {OPENAI_API_KEY}"}
+        )
+        await asyncio.to_thread(socket.getaddrinfo, "www.googleapis.com", 443)
+    except Exception as e:
+        logger.debug(f"Connection prewarm failed: {e}")
+
+
+async def repl():
+    # Async turns let Agno run the (sync) calendar tools in worker threads while
+    # the model stream and storage writes proceed on the event loop.
+    session = PromptSession()
+    prewarm = asyncio.create_task(_prewarm())
+    try:
+        while True:
+            user_input = (await session.prompt_async("\nYou: ")).strip()
+
+            if user_input.lower() in ['quit', 'exit']:
+                console.print("\n👋 Goodbye!")
+                console.print("📝 Your conversation is saved!")
+                break
+
+            if user_input:
+                await get_agent().aprint_response(user_input, stream=True, stream_intermediate_steps=True, console=console)
+    finally:
+        # Settle the prewarm before the loop closes, so a quick exit doesn't leave it pending
+        prewarm.cancel()
+        try:
+            await prewarm
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"Connection prewarm failed: {e}")
+
+
+def main():
+    asyncio.run(repl())
+
+
+if __name__ == "__main__":
+    main()
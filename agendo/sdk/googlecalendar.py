@@ -1,18 +1,33 @@
+import asyncio
+import atexit
 import datetime
-import json
+import inspect
 import os.path
-from functools import wraps
-from typing import Optional
-
+import re
+import sys
+import threading
+import time
+from functools import lru_cache, wraps
+from typing import List, Optional
+from urllib.parse import quote
+
+import httpx
+import orjson
 from agno.tools import Toolkit
 from agno.utils.log import logger
 
 try:
+    import google_auth_httplib2  # type: ignore
+    import requests
+    from google.auth.exceptions import RefreshError
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
-    from googleapiclient.discovery import build  # type: ignore
+    from googleapiclient.discovery import build_from_document  # type: ignore
+    from googleapiclient.discovery_cache import get_static_doc  # type: ignore
     from googleapiclient.errors import HttpError  # type: ignore
+    from googleapiclient.http import HttpRequest, build_http  # type: ignore
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     raise ImportError(
         "Google client library for Python not found , install it using `pip install --upgrade google-api-python-client google-auth-httplib2 google-auth-oauthlib`"
@@ -20,31 +35,272 @@ except ImportError:
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
+# Token file used when none is given, resolved once against the package rather than the CWD
+DEFAULT_TOKEN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "config", "credentials", "token.json")
+
+# Maximum number of sub-requests Google accepts in a single batch HTTP call
+BATCH_LIMIT = 1000
+
+# Python 3.11+ fromisoformat accepts the trailing "Z" Google uses for UTC
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime.datetime:
+        return datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+# Timestamps returned by the API are always full RFC 3339; the optional ciso8601 C parser
+# handles exactly that shape several times faster. User input keeps going through _parse_iso,
+# since it may be naive
+try:
+    from ciso8601 import parse_rfc3339 as _parse_rfc3339  # type: ignore
+except ImportError:
+    _parse_rfc3339 = _parse_iso
+
+_UTC = datetime.timezone.utc
+_ONE_DAY = datetime.timedelta(days=1)
+_FMT_API = "%Y-%m-%dT%H:%M:%S.%fZ"
+_FMT_DAY_HM = "%Y-%m-%d %H:%M"
+_FMT_HM = "%H:%M"
+_RFC3339_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})\Z")
+# The exact shape isoformat(timespec="seconds") produces, with or without an offset
+_EVENT_TIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}([+-]\d{2}:\d{2})?\Z")
+
+
+@lru_cache(maxsize=1024)
+def _format_all_day(start_date: str, end_date: str) -> str:
+    """Readable range for an all-day event; the API's end date is exclusive."""
+    if start_date == end_date:
+        return f"All day: {start_date} to {start_date}"
+    end_display = datetime.date.fromisoformat(end_date) - _ONE_DAY
+    return f"All day: {start_date} to {end_display.isoformat()}"
+
+
+@lru_cache(maxsize=1024)
+def _format_time_range(start_datetime: str, end_datetime: str) -> str:
+    """
+    Readable range for a timed event.
+
+    Cached on the raw API strings: recurring and re-listed events hit the cache and skip parsing.
+    """
+    start_dt = _parse_rfc3339(start_datetime)
+    end_dt = _parse_rfc3339(end_datetime)
+    end_fmt = _FMT_HM if start_dt.date() == end_dt.date() else _FMT_DAY_HM
+    return f"{start_dt.strftime(_FMT_DAY_HM)} - {end_dt.strftime(end_fmt)}"
+
+
+def _event_time(value: str) -> str:
+    """Normalize an ISO datetime to the seconds-precision form sent as an event's start/end dateTime."""
+    # Already in that form: skip the parse/format round trip
+    if _EVENT_TIME_RE.match(value):
+        return value
+    return _parse_iso(value).isoformat(timespec="seconds")
+
+
+def _dumps(obj) -> str:
+    """Serialize a tool result to compact UTF-8 JSON."""
+    return orjson.dumps(obj).decode()
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Cut long descriptions down to limit characters for agent consumption."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+# Partial-response masks: only the fields _parse_event reads are sent over the wire
+EVENT_FIELDS = "id,summary,description,eventType,location,start,end"
+EVENT_LIST_FIELDS = f"items({EVENT_FIELDS}),nextPageToken"
+CALENDAR_LIST_FIELDS = "items(id,summary,description,primary,accessRole,backgroundColor)"
+
+# Largest page requested from events().list; bigger listings are paged
+EVENTS_PAGE_SIZE = 250
+
+# REST endpoint used by the async variants, which bypass googleapiclient
+CALENDAR_API_URL = "https://www.googleapis.com/calendar/v3"
+
+# Google only compresses a response when the user agent contains "gzip"; googleapiclient's
+# JsonModel adds it to the sync requests, the async client sends it with these headers
+CALENDAR_API_HEADERS = {"Accept-Encoding": "gzip", "User-Agent": "agendo (gzip)"}
+
+# Seconds the calendarList response is reused before it is fetched again
+CALENDAR_CACHE_TTL = 300
+
+# Retries googleapiclient makes, with exponential backoff, on 429, 5xx and
+# rate-limit 403 responses; any other HttpError is raised on the first attempt
+API_RETRIES = 3
+
+# Seconds before the access token's expiry at which _authenticate stops trusting it
+# without a check; wider than google-auth's own refresh threshold (3m45s)
+TOKEN_EXPIRY_MARGIN = 300
+
+# Credentials, Calendar service and the time until which the credentials need no check, per
+# token file; shared by every GoogleCalendarTools instance in the process, so another instance
+# for the same user skips the token file read, the JSON parse, the validity check and the build
+_CREDS_CACHE: dict = {}
+_CREDS_CACHE_LOCK = threading.Lock()
+
+# One authentication lock per token file (guarded by _CREDS_CACHE_LOCK), so instances sharing
+# those credentials refresh them once instead of racing each other to the token endpoint
+_TOKEN_LOCKS: dict = {}
+
+# Token files that recently failed to load or refresh: absolute path -> (monotonic time, error).
+# Calls within NEGATIVE_CACHE_TTL seconds re-raise the error instead of re-reading the file or
+# retrying the refresh over the network
+NEGATIVE_CACHE_TTL = 5
+_NEG_CACHE: dict = {}
+
+# Refreshed credentials whose only change is the access token: absolute path -> Credentials.
+# The access token is re-derived from the refresh token, so these are written once at exit
+# instead of on every hourly refresh
+_DIRTY_TOKENS: dict = {}
+
+# Background refresher: every TOKEN_REFRESH_INTERVAL seconds it refreshes cached credentials
+# about to leave their check-free window, so tool calls don't wait on the token endpoint.
+# Token files unused for TOKEN_IDLE_TIMEOUT seconds are evicted and refresh on demand again
+TOKEN_REFRESH_INTERVAL = 60
+TOKEN_IDLE_TIMEOUT = 1800
+_LAST_USED: dict = {}
+_refresher: Optional[threading.Thread] = None
+
+
+@lru_cache(maxsize=1)
+def _calendar_discovery_doc() -> dict:
+    """
+    Calendar v3 discovery document bundled with googleapiclient, read and parsed once per process.
+
+    build() re-reads and re-parses the ~120 KB file for every service it creates.
+    """
+    return orjson.loads(get_static_doc("calendar", "v3"))
+
+
+@lru_cache(maxsize=1)
+def _auth_request() -> Request:
+    """
+    Transport for OAuth token refreshes, shared by every instance in the process.
+
+    A bare Request() opens a new requests.Session, and so a new TLS connection to
+    oauth2.googleapis.com, for each refresh; this one keeps the connection alive.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.2)))
+    return Request(session=session)
+
+
+def _token_lock(token_path: str) -> threading.Lock:
+    """The lock serializing authentication for one token file across every instance in the process."""
+    with _CREDS_CACHE_LOCK:
+        return _TOKEN_LOCKS.setdefault(os.path.abspath(token_path), threading.Lock())
+
+
+@lru_cache(maxsize=8)
+def _client_config(credentials_path: str) -> dict:
+    """OAuth client config from credentials.json, read and parsed once per file for the process."""
+    with open(credentials_path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _write_token(path: str, creds) -> None:
+    """Persist credentials atomically; a crash mid-write leaves the previous token file intact."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as token:
+        token.write(creds.to_json())
+    os.replace(tmp_path, path)
+
+
+def _valid_until(creds) -> float:
+    """Epoch time until which creds can be used without a check; google-auth keeps expiry as naive UTC."""
+    if creds.expiry is None:
+        # A token without an expiry never expires
+        return float("inf")
+    return creds.expiry.replace(tzinfo=_UTC).timestamp() - TOKEN_EXPIRY_MARGIN
+
+
+def _refresh_token(token_key: str, creds) -> None:
+    """Refresh creds in place and persist them; failures are negative-cached for the token file."""
+    refresh_token = creds.refresh_token
+    try:
+        creds.refresh(_auth_request())
+    except RefreshError as error:
+        _NEG_CACHE[token_key] = (time.monotonic(), error)
+        raise
+    # Only a rotated refresh token has to reach disk now
+    if creds.refresh_token == refresh_token:
+        _DIRTY_TOKENS[token_key] = creds
+    else:
+        _write_token(token_key, creds)
+        _DIRTY_TOKENS.pop(token_key, None)
+    _NEG_CACHE.pop(token_key, None)
+
+
+def _discard_token(token_key: str) -> None:
+    """Forget credentials whose refresh token Google rejected, in memory and on disk."""
+    with _CREDS_CACHE_LOCK:
+        _CREDS_CACHE.pop(token_key, None)
+    _DIRTY_TOKENS.pop(token_key, None)
+    try:
+        os.remove(token_key)
+    except FileNotFoundError:
+        pass
+
+
+def _refresh_loop() -> None:
+    """Body of the background refresher thread; see TOKEN_REFRESH_INTERVAL."""
+    while True:
+        time.sleep(TOKEN_REFRESH_INTERVAL)
+        now = time.time()
+        with _CREDS_CACHE_LOCK:
+            entries = list(_CREDS_CACHE.items())
+
+        for token_key, (creds, service, valid_until) in entries:
+            if now - _LAST_USED.get(token_key, 0.0) > TOKEN_IDLE_TIMEOUT:
+                with _CREDS_CACHE_LOCK:
+                    _CREDS_CACHE.pop(token_key, None)
+                continue
+            if valid_until - now > TOKEN_REFRESH_INTERVAL or not creds.refresh_token:
+                continue
+
+            with _token_lock(token_key):
+                # A tool call may have refreshed or replaced the credentials meanwhile
+                if _CREDS_CACHE.get(token_key, (None, None, 0.0))[2] != valid_until:
+                    continue
+                try:
+                    _refresh_token(token_key, creds)
+                except Exception as error:
+                    # Leave it to the next tool call, which reports or recovers from the failure
+                    logger.warning(f"Background token refresh failed for {token_key}: {error}")
+                    with _CREDS_CACHE_LOCK:
+                        _CREDS_CACHE.pop(token_key, None)
+                    continue
+                with _CREDS_CACHE_LOCK:
+                    _CREDS_CACHE[token_key] = (creds, service, _valid_until(creds))
+
+
+def _start_refresher() -> None:
+    """Start the background refresher thread once per process."""
+    global _refresher
+    with _CREDS_CACHE_LOCK:
+        if _refresher is None:
+            _refresher = threading.Thread(target=_refresh_loop, name="token-refresher", daemon=True)
+            _refresher.start()
+
+
+@atexit.register
+def _flush_dirty_tokens() -> None:
+    """Write the refreshed credentials deferred during the run."""
+    while _DIRTY_TOKENS:
+        path, creds = _DIRTY_TOKENS.popitem()
+        try:
+            _write_token(path, creds)
+        except OSError as error:
+            logger.warning(f"Could not save refreshed token to {path}: {error}")
+
 
 def authenticated(func):
     """Decorator to ensure authentication before executing the method."""
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        # Ensure credentials are valid
-        if os.path.exists(self.token_path):
-            self.creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                self.creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(self.creds_path, SCOPES)
-                self.creds = flow.run_local_server(port=0)
-                # Save the credentials for future use
-            with open(self.token_path, "w") as token:
-                token.write(self.creds.to_json())
-
-            # Initialize the Google Calendar service
-        try:
-            self.service = build("calendar", "v3", credentials=self.creds)
-        except HttpError as error:
-            logger.error(f"An error occurred while creating the service: {error}")
-            raise
+        self._authenticate()
 
         # Ensure the service is available
         if not self.service:
@@ -55,6 +311,48 @@ def authenticated(func):
     return wrapper
 
 
+def calendar_api(action: str):
+    """
+    Decorator that turns a tool method's failures into the JSON error results the agent reads.
+
+    A 404 or 410 on a method that takes an event_id names the event; other HttpErrors and any other
+    exception are logged and reported with their message. Authentication errors raised by
+    @authenticated, which wraps this, are left alone.
+
+    Args:
+        action: What the method does, for the generic message ("Error <action>: ...")
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except HttpError as error:
+                status = error.resp.status
+                if status in (404, 410):
+                    # The arguments are only bound on this rare path, so the call itself pays nothing
+                    bound = signature.bind(self, *args, **kwargs)
+                    bound.apply_defaults()
+                    event_id = bound.arguments.get("event_id")
+                    if event_id is not None:
+                        if status == 410:
+                            return _dumps({"error": f"Event '{event_id}' was already deleted"})
+                        calendar_id = bound.arguments.get("calendar_id")
+                        return _dumps({"error": f"Event '{event_id}' not found in calendar '{calendar_id}'"})
+                logger.error(f"An error occurred: {error}")
+                return _dumps({"error": f"An error occurred: {error}"})
+            except Exception as e:
+                logger.error(f"Error {action}: {e}")
+                return _dumps({"error": f"Error {action}: {e}"})
+
+        return wrapper
+
+    return decorator
+
+
 class GoogleCalendarTools(Toolkit):
     def __init__(
             self,
@@ -83,12 +381,19 @@ class GoogleCalendarTools(Toolkit):
 
         if not token_path:
             logger.warning(
-                f"Google Calendar Tool : Token path is not provided, using {os.getcwd()}/token.json as default path"
+                f"Google Calendar Tool : Token path is not provided, using {DEFAULT_TOKEN_PATH} as default path"
             )
-            token_path = "agendo/config/credentials/token.json"
+            token_path = DEFAULT_TOKEN_PATH
 
         self.creds = None
         self.service = None
+        self._calendar_cache = None
+        self._calendar_cache_ts = 0.0
+        self._async_client = None
+        self._local = threading.local()
+        self._auth_lock = _token_lock(token_path)
+        self._creds_valid_until = 0.0
+        self._token_key = os.path.abspath(token_path)
         self.token_path = token_path
         self.creds_path = credentials_path
 
@@ -98,102 +403,285 @@ class GoogleCalendarTools(Toolkit):
         self.register(self.list_calendars)
         self.register(self.list_events)
         self.register(self.create_event)
+        self.register(self.create_events)
+        self.register(self.query_free_busy)
         self.register(self.update_event)
         self.register(self.delete_event)
+        self.register(self.delete_events)
         self.register(self.get_event_by_id)
+        self.register(self.batch_get_events)
         self.register(self.search_events)
 
+    def _authenticate(self) -> None:
+        """Load, refresh or obtain OAuth credentials and build the Calendar service when needed."""
+        # Fast path: the token was checked and is nowhere near expiry, so skip the lock,
+        # the cache lookup and the validity check
+        now = time.time()
+        if now < self._creds_valid_until:
+            _LAST_USED[self._token_key] = now
+            return
+
+        # Concurrent tool calls, and other instances for the same token file, share the
+        # credentials; one thread refreshes them at a time
+        with self._auth_lock:
+            # Another thread may have refreshed them while this one waited
+            if time.time() < self._creds_valid_until:
+                return
+
+            # Ensure credentials are valid; the token file is only read on first use,
+            # afterwards the credentials live on the instance (and in _CREDS_CACHE)
+            creds_changed = False
+            token_key = self._token_key
+            _LAST_USED[token_key] = now
+            failure = _NEG_CACHE.get(token_key)
+            if failure is not None and time.monotonic() - failure[0] < NEGATIVE_CACHE_TTL:
+                raise failure[1].with_traceback(None)
+
+            # The registry wins over this instance's own copy: another instance may have
+            # refreshed the token or run a new OAuth flow since this one last looked
+            with _CREDS_CACHE_LOCK:
+                entry = _CREDS_CACHE.get(token_key)
+            if entry is not None and (self.creds is None or time.time() < entry[2]):
+                self.creds, self.service, valid_until = entry
+                # Already checked by the instance that cached them
+                if time.time() < valid_until:
+                    self._creds_valid_until = valid_until
+                    return
+            if self.creds is None:
+                # One open instead of a stat then an open; no file just means no token yet
+                try:
+                    with open(self.token_path, "rb") as token:
+                        self.creds = Credentials.from_authorized_user_info(orjson.loads(token.read()), SCOPES)
+                except FileNotFoundError:
+                    pass
+                except ValueError as error:
+                    _NEG_CACHE[token_key] = (time.monotonic(), error)
+                    raise
+            if self.creds and self.creds.expired and self.creds.refresh_token:
+                try:
+                    _refresh_token(token_key, self.creds)
+                except RefreshError as error:
+                    if "invalid_grant" not in str(error):
+                        raise
+                    # The refresh token was revoked or has expired and every retry would fail
+                    # the same way; drop it everywhere and fall through to a fresh consent
+                    _discard_token(token_key)
+                    self.creds = None
+                creds_changed = True
+            if not self.creds or not self.creds.valid:
+                # Only needed without a usable token; importing oauthlib and
+                # requests_oauthlib up front would cost every start ~15 ms
+                from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
+
+                flow = InstalledAppFlow.from_client_config(_client_config(self.creds_path), SCOPES)
+                self.creds = flow.run_local_server(port=0)
+                # Save the credentials for future use
+                _write_token(self.token_path, self.creds)
+                _DIRTY_TOKENS.pop(token_key, None)
+                _NEG_CACHE.pop(token_key, None)
+                creds_changed = True
+
+            # Initialize the Google Calendar service once, from the discovery document
+            # bundled with the client instead of fetching it over HTTPS
+            if self.service is None or creds_changed:
+                try:
+                    self.service = build_from_document(
+                        _calendar_discovery_doc(),
+                        http=google_auth_httplib2.AuthorizedHttp(self.creds, http=build_http()),
+                        requestBuilder=self._build_request
+                    )
+                except HttpError as error:
+                    logger.error(f"An error occurred while creating the service: {error}")
+                    raise
+
+            self._creds_valid_until = _valid_until(self.creds)
+            with _CREDS_CACHE_LOCK:
+                _CREDS_CACHE[token_key] = (self.creds, self.service, self._creds_valid_until)
+            _start_refresher()
+
+    def _build_request(self, http, *args, **kwargs) -> HttpRequest:
+        """
+        Request builder for the service that binds each request to the calling thread's connection.
+
+        httplib2 connections are not thread-safe, so each thread (e.g. the Scheduler's fetch pool)
+        keeps its own authorized Http and reuses it across requests.
+        """
+        local_http = getattr(self._local, "http", None)
+        if local_http is None or local_http.credentials is not self.creds:
+            local_http = google_auth_httplib2.AuthorizedHttp(self.creds, http=build_http())
+            self._local.http = local_http
+        return HttpRequest(local_http, *args, **kwargs)
+
+    @staticmethod
+    def _parse_one(event: dict, calendar_name: str) -> dict:
+        """Simplify a single event resource; see _parse_event."""
+        get = event.get
+        start_info = get("start") or {}
+        end_info = get("end") or {}
+
+        # Handle all-day events (date only) vs timed events (dateTime)
+        start_date = start_info.get("date")
+        if start_date is not None:
+            # All-day event
+            time_info = _format_all_day(start_date, end_info["date"])
+        else:
+            # Timed event
+            start_datetime = start_info.get("dateTime")
+            end_datetime = end_info.get("dateTime")
+
+            if start_datetime and end_datetime:
+                try:
+                    time_info = _format_time_range(start_datetime, end_datetime)
+                except Exception as e:
+                    time_info = f"Time parsing error: {e}"
+            else:
+                time_info = "Time not specified"
+
+        parsed_event = {
+            "id": get("id"),
+            "title": get("summary", "No Title"),
+            "time": time_info,
+            "type": get("eventType", "default"),
+            "calendar": calendar_name
+        }
+
+        # Add optional fields only if they exist
+        location = get("location")
+        if location:
+            parsed_event["location"] = location
+        description = get("description")
+        if description:
+            parsed_event["description"] = _truncate(description.strip())
+
+        return parsed_event
+
     @staticmethod
-    def _parse_event(events_json: str, calendar_name: str = "Google Calendar") -> str:
+    def _parse_event(events: list, calendar_name: str = "Google Calendar", indent: bool = False) -> str:
         """
-        Parse Google Calendar events JSON into simplified format for AI agent consumption.
+        Parse Google Calendar events into simplified format for AI agent consumption.
 
         Args:
-            events_json: JSON string from Google Calendar API
+            events: List of event resources from the Google Calendar API
             calendar_name: Name of the calendar these events belong to
+            indent: Pretty-print the JSON; the compact default saves tokens when the agent reads it
 
         Returns:
             JSON string with simplified event information
         """
         try:
-            events = json.loads(events_json)
-
             if isinstance(events, dict) and "error" in events:
-                return events_json  # Return error as-is
+                return _dumps(events)  # Return error as-is
 
             if not events:
-                return json.dumps({"message": "No events found."})
-
-            parsed_events = []
-            for event in events:
-                # Extract basic info
-                title = event.get("summary", "No Title")
-                description = event.get("description", "")
-                event_type = event.get("eventType", "default")
-                location = event.get("location", "")
-
-                # Parse start and end times
-                start_info = event.get("start", {})
-                end_info = event.get("end", {})
-
-                # Handle all-day events (date only) vs timed events (dateTime)
-                if "date" in start_info:
-                    # All-day event
-                    start_date = start_info["date"]
-                    end_date = end_info["date"]
-                    time_info = f"All day: {start_date} to {start_date}"
-                    if start_date != end_date:
-                        # Multi-day event
-                        end_display = datetime.datetime.fromisoformat(end_date) - datetime.timedelta(days=1)
-                        time_info = f"All day: {start_date} to {end_display.strftime('%Y-%m-%d')}"
-                else:
-                    # Timed event
-                    start_datetime = start_info.get("dateTime", "")
-                    end_datetime = end_info.get("dateTime", "")
-
-                    if start_datetime and end_datetime:
-                        try:
-                            start_dt = datetime.datetime.fromisoformat(start_datetime.replace('Z', '+00:00'))
-                            end_dt = datetime.datetime.fromisoformat(end_datetime.replace('Z', '+00:00'))
-
-                            # Format for readability
-                            if start_dt.date() == end_dt.date():
-                                # Same day
-                                time_info = f"{start_dt.strftime('%Y-%m-%d %H:%M')} - {end_dt.strftime('%H:%M')}"
-                            else:
-                                # Multi-day
-                                time_info = f"{start_dt.strftime('%Y-%m-%d %H:%M')} - {end_dt.strftime('%Y-%m-%d %H:%M')}"
-                        except Exception as e:
-                            time_info = f"Time parsing error: {e}"
-                    else:
-                        time_info = "Time not specified"
-
-                # Build parsed event object
-                parsed_event = {
-                    "title": title,
-                    "time": time_info,
-                    "type": event_type,
-                    "calendar": calendar_name
-                }
-
-                # Add optional fields only if they exist
-                if location:
-                    parsed_event["location"] = location
-
-                if description:
-                    # Truncate long descriptions
-                    desc = description.strip()
-                    if len(desc) > 100:
-                        desc = desc[:100] + "..."
-                    parsed_event["description"] = desc
-
-                parsed_events.append(parsed_event)
-
-            return json.dumps(parsed_events, ensure_ascii=False, indent=2)
+                return _dumps({"message": "No events found."})
+
+            calendar_name = sys.intern(calendar_name)
+            parse_one = GoogleCalendarTools._parse_one
+            parsed_events = [parse_one(event, calendar_name) for event in events]
+
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(parsed_events, option=option).decode()
 
         except Exception as e:
             logger.error(f"Error parsing events: {e}")
-            return json.dumps({"error": f"Error parsing events: {e}"})
+            return _dumps({"error": f"Error parsing events: {e}"})
+
+    @staticmethod
+    def _build_event_body(
+            start_datetime: str,
+            end_datetime: str,
+            title: Optional[str] = None,
+            description: Optional[str] = None,
+            location: Optional[str] = None
+    ) -> dict:
+        """Build an events().insert body from ISO start/end strings."""
+        start_time = _event_time(start_datetime)
+        end_time = _event_time(end_datetime)
+        return {
+            "summary": title,
+            "location": location,
+            "description": description,
+            "start": {"dateTime": start_time},
+            "end": {"dateTime": end_time},
+        }
+
+    @staticmethod
+    def _to_rfc3339(value: str) -> str:
+        """Convert an ISO date or datetime string to the UTC RFC 3339 form used for timeMin/timeMax."""
+        # Already RFC 3339 (with a zone): the API accepts it as-is
+        if _RFC3339_RE.match(value):
+            return value
+        dt = _parse_iso(value)
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(_UTC)
+        return dt.strftime(_FMT_API)
+
+    def _list_events(self, limit: int, **params) -> list:
+        """
+        Collect up to limit events, following nextPageToken page by page.
+
+        Pages are only fetched while more events are needed, and each one asks for no more than
+        the events still missing, so the last page doesn't download events that are thrown away.
+        """
+        events = []
+        page_token = None
+        while len(events) < limit:
+            response = self.service.events().list(
+                maxResults=min(EVENTS_PAGE_SIZE, limit - len(events)), pageToken=page_token, **params
+            ).execute(num_retries=API_RETRIES)
+            events.extend(response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+        return events
+
+    def _execute_batch(self, requests: list) -> list:
+        """
+        Execute API requests through BatchHttpRequest, one HTTP call per BATCH_LIMIT requests.
+
+        Args:
+            requests: googleapiclient HttpRequest objects (not yet executed)
+
+        Returns:
+            List with one entry per request, in order: the response or an {"error": ...} dict
+        """
+        results = [None] * len(requests)
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                results[int(request_id)] = {"error": f"An error occurred: {exception}"}
+            else:
+                results[int(request_id)] = response
+
+        for offset in range(0, len(requests), BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for index, request in enumerate(requests[offset:offset + BATCH_LIMIT], start=offset):
+                batch.add(request, request_id=str(index))
+            batch.execute()
+
+        return results
+
+    def _get_calendar_cache(self) -> dict:
+        """
+        Return the cached calendarList, refetching it once CALENDAR_CACHE_TTL has passed.
+
+        Returns:
+            Dict with "items" (raw calendar list), "ids" ({lowercase name: id}) and "names" ({id: name})
+        """
+        if self._calendar_cache is None or time.monotonic() - self._calendar_cache_ts >= CALENDAR_CACHE_TTL:
+            calendars = self.service.calendarList().list(fields=CALENDAR_LIST_FIELDS).execute(num_retries=API_RETRIES).get('items', [])
+            ids = {}
+            names = {}
+            for calendar in calendars:
+                calendar_id = calendar.get("id")
+                calendar_name = calendar.get("summary", "")
+                ids.setdefault(calendar_name.lower(), calendar_id)
+                names[calendar_id] = calendar_name
+                if calendar.get("primary"):
+                    names["primary"] = calendar_name
+            self._calendar_cache = {"items": calendars, "ids": ids, "names": names}
+            self._calendar_cache_ts = time.monotonic()
+        return self._calendar_cache
 
     @authenticated
     def _get_calendar_id_by_name(self, calendar_identifier: str) -> str:
@@ -212,20 +700,17 @@ class GoogleCalendarTools(Toolkit):
 
         try:
             if self.service:
-                calendars_result = self.service.calendarList().list().execute()
-                calendars = calendars_result.get('items', [])
+                calendar_ids = self._get_calendar_cache()["ids"]
+                needle = calendar_identifier.lower()
 
                 # Search for calendar by name (case-insensitive)
-                for calendar in calendars:
-                    calendar_name = calendar.get("summary", "")
-                    if calendar_name.lower() == calendar_identifier.lower():
-                        return calendar.get("id", calendar_identifier)
+                if needle in calendar_ids:
+                    return calendar_ids[needle]
 
                 # If not found by exact match, try partial match
-                for calendar in calendars:
-                    calendar_name = calendar.get("summary", "")
-                    if calendar_identifier.lower() in calendar_name.lower():
-                        return calendar.get("id", calendar_identifier)
+                for calendar_name, calendar_id in calendar_ids.items():
+                    if needle in calendar_name:
+                        return calendar_id
 
                 # If still not found, return original identifier
                 logger.warning(f"Calendar '{calendar_identifier}' not found, using as-is")
@@ -236,7 +721,31 @@ class GoogleCalendarTools(Toolkit):
             logger.error(f"Error looking up calendar: {error}")
             return calendar_identifier
 
+    def _get_calendar_name_by_id(self, calendar_id: str) -> str:
+        """Helper method to get a calendar's display name from the cached calendar list."""
+        try:
+            return self._get_calendar_cache()["names"].get(calendar_id, calendar_id)
+        except HttpError as error:
+            logger.error(f"Error looking up calendar: {error}")
+            return calendar_id
+
+    def _resolve_calendar(self, calendar_identifier: str) -> tuple:
+        """
+        Resolve a calendar name or ID in one step.
+
+        Args:
+            calendar_identifier: Either calendar name or calendar ID
+
+        Returns:
+            Tuple of (calendar_id, display_name); a name given by the user is kept as the display name
+        """
+        calendar_id = self._get_calendar_id_by_name(calendar_identifier)
+        if calendar_id != calendar_identifier:
+            return calendar_id, calendar_identifier
+        return calendar_id, self._get_calendar_name_by_id(calendar_id)
+
     @authenticated
+    @calendar_api("listing calendars")
     def list_calendars(self) -> str:
         """
         List all calendars available to the user.
@@ -244,89 +753,87 @@ class GoogleCalendarTools(Toolkit):
         Returns:
             JSON string with calendar information
         """
-        try:
-            if self.service:
-                calendars_result = self.service.calendarList().list().execute()
-                calendars = calendars_result.get('items', [])
-
-                if not calendars:
-                    return json.dumps({"message": "No calendars found."})
-
-                # Simplify calendar info
-                simplified_calendars = []
-                for calendar in calendars:
-                    simplified_calendars.append({
-                        "id": calendar.get("id"),
-                        "name": calendar.get("summary"),
-                        "description": calendar.get("description", ""),
-                        "primary": calendar.get("primary", False),
-                        "access_role": calendar.get("accessRole", ""),
-                        "background_color": calendar.get("backgroundColor", "")
-                    })
-
-                return json.dumps(simplified_calendars, ensure_ascii=False, indent=2)
-            else:
-                return json.dumps({"error": "authentication issue"})
-        except HttpError as error:
-            logger.error(f"An error occurred: {error}")
-            return json.dumps({"error": f"An error occurred: {error}"})
+        if self.service:
+            calendars = self._get_calendar_cache()["items"]
+
+            if not calendars:
+                return _dumps({"message": "No calendars found."})
+
+            # Simplify calendar info
+            simplified_calendars = []
+            for calendar in calendars:
+                simplified_calendars.append({
+                    "id": calendar.get("id"),
+                    "name": calendar.get("summary"),
+                    "description": calendar.get("description", ""),
+                    "primary": calendar.get("primary", False),
+                    "access_role": calendar.get("accessRole", ""),
+                    "background_color": calendar.get("backgroundColor", "")
+                })
+
+            return _dumps(simplified_calendars)
+        else:
+            return _dumps({"error": "authentication issue"})
 
     @authenticated
+    @calendar_api("listing events")
     def list_events(
             self,
             limit: int = 10,
-            date_from: str = datetime.date.today().isoformat(),
-            calendar_id: str = "primary"
+            date_from: Optional[str] = None,
+            calendar_id: str = "primary",
+            date_to: Optional[str] = None,
+            expand_recurring: bool = True
     ) -> str:
         """
         List events from the specified calendar.
 
         Args:
             limit (Optional[int]): Number of events to return, default value is 10
-            date_from (str): the start date to return events from in date isoformat. Defaults to current datetime.
+            date_from (Optional[str]): the start date to return events from in date isoformat. Defaults to current datetime.
             calendar_id (str): ID or name of the calendar to list events from. Defaults to "primary".
+            date_to (Optional[str]): exclusive end date/datetime in isoformat; events starting from then on are left out. Defaults to no bound.
+            expand_recurring (bool): List every occurrence of recurring events in start order. Set to False to get
+                each recurring series once, as its first occurrence, in no particular order. Defaults to True.
         """
-        # Resolve calendar name to ID if needed
-        resolved_calendar_id = self._get_calendar_id_by_name(calendar_id)
-
-        # Determine display name for the calendar
-        if "@" not in calendar_id and calendar_id != "primary":
-            # User provided a name, use it as display name
-            calendar_display_name = calendar_id
-        else:
-            # User provided an ID, look up the display name
-            calendar_display_name = self._get_calendar_id_by_name(resolved_calendar_id)
+        # Resolve calendar name to ID and display name
+        resolved_calendar_id, calendar_display_name = self._resolve_calendar(calendar_id)
 
+        # Resolved per call: a default in the signature would be frozen at import time
         if date_from is None:
-            date_from = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        elif isinstance(date_from, str):
-            date_from = datetime.datetime.fromisoformat(date_from).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            date_from = datetime.datetime.now(_UTC).isoformat(timespec="seconds")
+        else:
+            date_from = self._to_rfc3339(date_from)
 
-        try:
-            if self.service:
-                events_result = (
-                    self.service.events()
-                    .list(
-                        calendarId=resolved_calendar_id,
-                        timeMin=date_from,
-                        maxResults=limit,
-                        singleEvents=True,
-                        orderBy="startTime",
-                    )
-                    .execute()
-                )
-                events = events_result.get("items", [])
-                if not events:
-                    return f"No upcoming events found in calendar '{calendar_display_name}'."
+        params = {}
+        if date_to is not None:
+            params["timeMax"] = self._to_rfc3339(date_to)
+        if expand_recurring:
+            params.update(singleEvents=True, orderBy="startTime", fields=EVENT_LIST_FIELDS)
+        else:
+            # One entry per series instead of one per occurrence; the API only orders expanded
+            # listings by start time, and recurringEventId marks the modified occurrences to drop
+            params.update(singleEvents=False, showDeleted=False,
+                          fields=f"items({EVENT_FIELDS},recurringEventId),nextPageToken")
+
+        if self.service:
+            events = self._list_events(
+                limit,
+                calendarId=resolved_calendar_id,
+                timeMin=date_from,
+                **params
+            )
+            if not expand_recurring:
+                events = [event for event in events if "recurringEventId" not in event]
+            if not events:
+                return f"No upcoming events found in calendar '{calendar_display_name}'."
 
-                events_json = json.dumps(events)
-                return self._parse_event(events_json, calendar_display_name)
-            else:
-                return json.dumps({"error": "authentication issue"})
-        except HttpError as error:
-            return json.dumps({"error": f"An error occurred: {error}"})
+            return self._parse_event(events, calendar_display_name)
+        else:
+            return _dumps({"error": "authentication issue"})
 
     @authenticated
+    @calendar_api("creating event")
     def create_event(
             self,
             start_datetime: str,
@@ -350,35 +857,109 @@ class GoogleCalendarTools(Toolkit):
         # Resolve calendar name to ID if needed
         resolved_calendar_id = self._get_calendar_id_by_name(calendar_id)
 
-        start_time = datetime.datetime.fromisoformat(start_datetime).strftime("%Y-%m-%dT%H:%M:%S")
-        end_time = datetime.datetime.fromisoformat(end_datetime).strftime("%Y-%m-%dT%H:%M:%S")
+        event = self._build_event_body(start_datetime, end_datetime, title, description, location)
 
-        try:
-            event = {
-                "summary": title,
-                "location": location,
-                "description": description,
-                "start": {"dateTime": start_time},
-                "end": {"dateTime": end_time},
-            }
+        if self.service:
+            event_result = (
+                self.service.events()
+                .insert(
+                    calendarId=resolved_calendar_id,
+                    body=event,
+                    fields=EVENT_FIELDS,
+                )
+                .execute(num_retries=API_RETRIES)
+            )
+            return _dumps(event_result)
+        else:
+            return _dumps({"error": "authentication issue"})
 
-            if self.service:
-                event_result = (
-                    self.service.events()
-                    .insert(
-                        calendarId=resolved_calendar_id,
-                        body=event,
-                    )
-                    .execute()
+    @authenticated
+    @calendar_api("creating events")
+    def create_events(self, events: List[dict], calendar_id: str = "primary") -> str:
+        """
+        Create several events in one batched HTTP request. Prefer this over repeated create_event calls.
+
+        Args:
+            events (List[dict]): Events to create, each with "start_datetime" and "end_datetime" in ISO format
+                and optional "title", "description" and "location"
+            calendar_id (str): ID or name of the calendar to create the events in. Defaults to "primary".
+
+        Returns:
+            JSON string with one created event (or error) per input event, in order
+
+        Example:
+            create_events([
+                {"title": "Standup", "start_datetime": "2025-06-25T09:00:00", "end_datetime": "2025-06-25T09:15:00"},
+                {"title": "Review", "start_datetime": "2025-06-25T14:00:00", "end_datetime": "2025-06-25T15:00:00"}
+            ])
+        """
+        if not events:
+            return _dumps({"error": "No events provided"})
+
+        # Resolve calendar name to ID if needed
+        resolved_calendar_id = self._get_calendar_id_by_name(calendar_id)
+
+        if self.service:
+            requests = [
+                self.service.events().insert(
+                    calendarId=resolved_calendar_id,
+                    body=self._build_event_body(
+                        event["start_datetime"], event["end_datetime"], event.get("title"),
+                        event.get("description"), event.get("location")
+                    ),
+                    fields=EVENT_FIELDS,
                 )
-                return json.dumps(event_result)
-            else:
-                return json.dumps({"error": "authentication issue"})
-        except HttpError as error:
-            logger.error(f"An error occurred: {error}")
-            return json.dumps({"error": f"An error occurred: {error}"})
+                for event in events
+            ]
+            return _dumps(self._execute_batch(requests))
+        else:
+            return _dumps({"error": "authentication issue"})
+
+    @authenticated
+    @calendar_api("querying free/busy")
+    def query_free_busy(self, time_min: str, time_max: str, calendar_ids: List[str]) -> str:
+        """
+        Get busy intervals for several calendars with a single freebusy request.
+
+        Args:
+            time_min (str): Start of the window in ISO format (naive values are treated as UTC)
+            time_max (str): End of the window in ISO format (naive values are treated as UTC)
+            calendar_ids (List[str]): IDs or names of the calendars to query
+
+        Returns:
+            JSON string {"busy": {calendar: [{"start", "end"}, ...]}, "errors": {calendar: [...]}}, keyed on
+            the calendars as requested. A calendar the API could not read (notFound, forbidden,
+            tooManyCalendars) appears only under "errors", with the API's error list. Or error message
+        """
+        # Keyed on the requested names, so two names for the same calendar each get an entry
+        resolved_calendar_ids = [(c, self._get_calendar_id_by_name(c)) for c in calendar_ids]
+
+        if self.service:
+            result = (
+                self.service.freebusy()
+                .query(body={
+                    "timeMin": self._to_rfc3339(time_min),
+                    "timeMax": self._to_rfc3339(time_max),
+                    "items": [{"id": cid} for cid in dict.fromkeys(cid for _, cid in resolved_calendar_ids)],
+                })
+                .execute(num_retries=API_RETRIES)
+            )
+            calendars = result.get("calendars", {})
+            busy, errors = {}, {}
+            for name, cid in resolved_calendar_ids:
+                calendar = calendars.get(cid)
+                if calendar is None:
+                    errors[name] = [{"domain": "global", "reason": "notFound"}]
+                elif calendar.get("errors"):
+                    errors[name] = calendar["errors"]
+                else:
+                    busy[name] = calendar.get("busy", [])
+            return _dumps({"busy": busy, "errors": errors})
+        else:
+            return _dumps({"error": "authentication issue"})
 
     @authenticated
+    @calendar_api("updating event")
     def update_event(
             self,
             event_id: str,
@@ -417,70 +998,51 @@ class GoogleCalendarTools(Toolkit):
         # Resolve calendar name to ID if needed
         resolved_calendar_id = self._get_calendar_id_by_name(calendar_id)
 
-        try:
-            if self.service:
-                # First, get the existing event
-                existing_event = (
-                    self.service.events()
-                    .get(calendarId=resolved_calendar_id, eventId=event_id)
-                    .execute()
-                )
-
-                # Prepare updates - only update fields that are provided
-                updates = {}
-
-                if title is not None:
-                    updates["summary"] = title
+        if self.service:
+            # Prepare updates - only update fields that are provided
+            updates = {}
 
-                if description is not None:
-                    updates["description"] = description
+            if title is not None:
+                updates["summary"] = title
 
-                if location is not None:
-                    updates["location"] = location
+            if description is not None:
+                updates["description"] = description
 
-                if start_datetime is not None:
-                    start_time = datetime.datetime.fromisoformat(start_datetime).strftime("%Y-%m-%dT%H:%M:%S")
-                    updates["start"] = {"dateTime": start_time}
+            if location is not None:
+                updates["location"] = location
 
-                if end_datetime is not None:
-                    end_time = datetime.datetime.fromisoformat(end_datetime).strftime("%Y-%m-%dT%H:%M:%S")
-                    updates["end"] = {"dateTime": end_time}
+            if start_datetime is not None:
+                start_time = _event_time(start_datetime)
+                updates["start"] = {"dateTime": start_time}
 
-                # If no updates provided, return error
-                if not updates:
-                    return json.dumps({"error": "No update fields provided"})
+            if end_datetime is not None:
+                end_time = _event_time(end_datetime)
+                updates["end"] = {"dateTime": end_time}
 
-                # Merge updates with existing event
-                updated_event = {**existing_event, **updates}
+            # If no updates provided, return error
+            if not updates:
+                return _dumps({"error": "No update fields provided"})
 
-                # Update the event
-                result = (
-                    self.service.events()
-                    .update(
-                        calendarId=resolved_calendar_id,
-                        eventId=event_id,
-                        body=updated_event
-                    )
-                    .execute()
+            # Patch sends only the changed fields; no need to fetch the event first
+            result = (
+                self.service.events()
+                .patch(
+                    calendarId=resolved_calendar_id,
+                    eventId=event_id,
+                    body=updates,
+                    fields=EVENT_FIELDS
                 )
+                .execute(num_retries=API_RETRIES)
+            )
 
-                # Parse and return the updated event in simplified format
-                return self._parse_event(json.dumps([result]), calendar_id)
+            # Parse and return the updated event in simplified format
+            return self._parse_event([result], calendar_id)
 
-            else:
-                return json.dumps({"error": "authentication issue"})
-
-        except HttpError as error:
-            if error.resp.status == 404:
-                return json.dumps({"error": f"Event '{event_id}' not found in calendar '{calendar_id}'"})
-            else:
-                logger.error(f"An error occurred: {error}")
-                return json.dumps({"error": f"An error occurred: {error}"})
-        except Exception as e:
-            logger.error(f"Error updating event: {e}")
-            return json.dumps({"error": f"Error updating event: {e}"})
+        else:
+            return _dumps({"error": "authentication issue"})
 
     @authenticated
+    @calendar_api("deleting event")
     def delete_event(self, event_id: str, calendar_id: str = "primary") -> str:
         """
         Delete an existing event from the specified calendar.
@@ -499,35 +1061,64 @@ class GoogleCalendarTools(Toolkit):
         # Resolve calendar name to ID if needed
         resolved_calendar_id = self._get_calendar_id_by_name(calendar_id)
 
-        try:
-            if self.service:
-                # Delete the event
-                self.service.events().delete(
-                    calendarId=resolved_calendar_id,
-                    eventId=event_id
-                ).execute()
+        if self.service:
+            # Delete the event
+            self.service.events().delete(
+                calendarId=resolved_calendar_id,
+                eventId=event_id
+            ).execute(num_retries=API_RETRIES)
 
-                return json.dumps({
-                    "success": True,
-                    "message": f"Event '{event_id}' deleted successfully from calendar '{calendar_id}'"
-                })
+            return _dumps({
+                "success": True,
+                "message": f"Event '{event_id}' deleted successfully from calendar '{calendar_id}'"
+            })
 
-            else:
-                return json.dumps({"error": "authentication issue"})
+        else:
+            return _dumps({"error": "authentication issue"})
 
-        except HttpError as error:
-            if error.resp.status == 404:
-                return json.dumps({"error": f"Event '{event_id}' not found in calendar '{calendar_id}'"})
-            elif error.resp.status == 410:
-                return json.dumps({"error": f"Event '{event_id}' was already deleted"})
-            else:
-                logger.error(f"An error occurred: {error}")
-                return json.dumps({"error": f"An error occurred: {error}"})
-        except Exception as e:
-            logger.error(f"Error deleting event: {e}")
-            return json.dumps({"error": f"Error deleting event: {e}"})
+    @authenticated
+    @calendar_api("deleting events")
+    def delete_events(self, event_ids: List[str], calendar_id: str = "primary") -> str:
+        """
+        Delete several events in one batched HTTP request. Prefer this over repeated delete_event calls.
+
+        Args:
+            event_ids (List[str]): IDs of the events to delete
+            calendar_id (str): ID or name of the calendar containing the events. Defaults to "primary".
+
+        Returns:
+            JSON string with the deleted IDs, plus an "errors" entry for IDs that could not be deleted
+
+        Example:
+            delete_events(["event123", "event456"])
+        """
+        if not event_ids:
+            return _dumps({"error": "No event IDs provided"})
+
+        # Resolve calendar name to ID if needed
+        resolved_calendar_id = self._get_calendar_id_by_name(calendar_id)
+
+        if self.service:
+            results = self._execute_batch([
+                self.service.events().delete(calendarId=resolved_calendar_id, eventId=event_id)
+                for event_id in event_ids
+            ])
+            errors = {
+                event_id: r["error"] for event_id, r in zip(event_ids, results) if isinstance(r, dict) and "error" in r
+            }
+            response = {
+                "success": not errors,
+                "deleted": [event_id for event_id in event_ids if event_id not in errors],
+                "message": f"Deleted {len(event_ids) - len(errors)} of {len(event_ids)} events from calendar '{calendar_id}'"
+            }
+            if errors:
+                response["errors"] = errors
+            return _dumps(response)
+        else:
+            return _dumps({"error": "authentication issue"})
 
     @authenticated
+    @calendar_api("getting event")
     def get_event_by_id(self, event_id: str, calendar_id: str = "primary") -> str:
         """
         Get a specific event by its ID.
@@ -543,47 +1134,70 @@ class GoogleCalendarTools(Toolkit):
             get_event_by_id("event123")
             get_event_by_id("event123", calendar_id="Todoist")
         """
-        # Resolve calendar name to ID if needed
-        resolved_calendar_id = self._get_calendar_id_by_name(calendar_id)
+        # Resolve calendar name to ID and display name
+        resolved_calendar_id, calendar_display_name = self._resolve_calendar(calendar_id)
+
+        if self.service:
+            # Get the event
+            event = (
+                self.service.events()
+                .get(calendarId=resolved_calendar_id, eventId=event_id, fields=EVENT_FIELDS)
+                .execute(num_retries=API_RETRIES)
+            )
+
+            # Parse and return the event in simplified format
+            return self._parse_event([event], calendar_display_name)
 
-        # Determine display name for the calendar
-        if "@" not in calendar_id and calendar_id != "primary":
-            calendar_display_name = calendar_id
         else:
-            calendar_display_name = self._get_calendar_id_by_name(resolved_calendar_id)
+            return _dumps({"error": "authentication issue"})
 
-        try:
-            if self.service:
-                # Get the event
-                event = (
-                    self.service.events()
-                    .get(calendarId=resolved_calendar_id, eventId=event_id)
-                    .execute()
-                )
+    @authenticated
+    @calendar_api("getting events")
+    def batch_get_events(self, event_ids: List[str], calendar_id: str = "primary") -> str:
+        """
+        Get several events by ID in one batched HTTP request.
 
-                # Parse and return the event in simplified format
-                return self._parse_event(json.dumps([event]), calendar_display_name)
+        Args:
+            event_ids (List[str]): IDs of the events to retrieve
+            calendar_id (str): ID or name of the calendar containing the events. Defaults to "primary".
 
-            else:
-                return json.dumps({"error": "authentication issue"})
+        Returns:
+            JSON string with the found events, plus an "errors" entry for IDs that could not be fetched
 
-        except HttpError as error:
-            if error.resp.status == 404:
-                return json.dumps({"error": f"Event '{event_id}' not found in calendar '{calendar_id}'"})
-            else:
-                logger.error(f"An error occurred: {error}")
-                return json.dumps({"error": f"An error occurred: {error}"})
-        except Exception as e:
-            logger.error(f"Error getting event: {e}")
-            return json.dumps({"error": f"Error getting event: {e}"})
+        Example:
+            batch_get_events(["event123", "event456"])
+        """
+        if not event_ids:
+            return _dumps({"error": "No event IDs provided"})
+
+        # Resolve calendar name to ID and display name
+        resolved_calendar_id, calendar_display_name = self._resolve_calendar(calendar_id)
+
+        if self.service:
+            results = self._execute_batch([
+                self.service.events().get(calendarId=resolved_calendar_id, eventId=event_id, fields=EVENT_FIELDS)
+                for event_id in event_ids
+            ])
+            events = [r for r in results if "error" not in r]
+            errors = {event_id: r["error"] for event_id, r in zip(event_ids, results) if "error" in r}
+            if not errors:
+                return self._parse_event(events, calendar_display_name)
+
+            return _dumps({
+                "events": orjson.loads(self._parse_event(events, calendar_display_name)) if events else [],
+                "errors": errors
+            })
+        else:
+            return _dumps({"error": "authentication issue"})
 
     @authenticated
+    @calendar_api("searching events")
     def search_events(
             self,
             query: str,
             calendar_id: str = "primary",
             max_results: int = 50,
-            date_range: tuple = None
+            date_range: Optional[tuple] = None
     ) -> str:
         """
         Search events by keywords in title, description, or location.
@@ -601,56 +1215,155 @@ class GoogleCalendarTools(Toolkit):
             search_events("meeting")
             search_events("pwn.college", calendar_id="primary", date_range=("2025-06-01", "2025-06-30"))
         """
-        # Resolve calendar name to ID if needed
-        resolved_calendar_id = self._get_calendar_id_by_name(calendar_id)
+        # Resolve calendar name to ID and display name
+        resolved_calendar_id, calendar_display_name = self._resolve_calendar(calendar_id)
+
+        if self.service:
+            # Prepare search parameters
+            search_params = {
+                'calendarId': resolved_calendar_id,
+                'q': query,
+                'singleEvents': True,
+                'orderBy': 'startTime',
+                'fields': EVENT_LIST_FIELDS
+            }
+
+            # Add date range if provided
+            if date_range:
+                start_date, end_date = date_range
+                # Convert to datetime with time for API
+                time_min = datetime.datetime.fromisoformat(start_date).strftime(_FMT_API)
+                time_max = datetime.datetime.fromisoformat(end_date + "T23:59:59").strftime(_FMT_API)
+                search_params['timeMin'] = time_min
+                search_params['timeMax'] = time_max
+
+            # Execute search
+            events = self._list_events(max_results, **search_params)
+
+            if not events:
+                return _dumps({
+                    "message": f"No events found matching '{query}' in calendar '{calendar_display_name}'"
+                })
+
+            return self._parse_event(events, calendar_display_name)
 
-        # Determine display name for the calendar
-        if "@" not in calendar_id and calendar_id != "primary":
-            calendar_display_name = calendar_id
         else:
-            calendar_display_name = self._get_calendar_id_by_name(resolved_calendar_id)
+            return _dumps({"error": "authentication issue"})
+
+    # =================== ASYNC VARIANTS ===================
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict:
+        """
+        Send an authorized request to the Calendar REST API over a shared keep-alive HTTP/2 client.
+
+        The access token is taken from the in-memory credentials and only refreshed once expired.
+        """
+        if self.creds is None or not self.creds.valid or self.service is None:
+            await asyncio.to_thread(self._authenticate)
+
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=CALENDAR_API_URL, headers=CALENDAR_API_HEADERS, http2=True, timeout=30
+            )
+
+        response = await self._async_client.request(
+            method, path, headers={"Authorization": f"Bearer {self.creds.token}"}, **kwargs
+        )
+        response.raise_for_status()
+        # httpx's response.json() decodes with the stdlib json module
+        return orjson.loads(response.content) if response.content else {}
 
+    async def aclose(self) -> None:
+        """Close the async HTTP client used by the *_async methods."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def list_events_async(
+            self,
+            limit: int = 10,
+            date_from: Optional[str] = None,
+            calendar_id: str = "primary"
+    ) -> str:
+        """
+        Async variant of list_events; concurrent calls share one connection instead of blocking each other.
+
+        Args:
+            limit (Optional[int]): Number of events to return, default value is 10
+            date_from (Optional[str]): the start date to return events from in date isoformat. Defaults to current datetime.
+            calendar_id (str): ID or name of the calendar to list events from. Defaults to "primary".
+        """
         try:
-            if self.service:
-                # Prepare search parameters
-                search_params = {
-                    'calendarId': resolved_calendar_id,
-                    'q': query,
-                    'maxResults': max_results,
-                    'singleEvents': True,
-                    'orderBy': 'startTime'
-                }
-
-                # Add date range if provided
-                if date_range:
-                    start_date, end_date = date_range
-                    # Convert to datetime with time for API
-                    time_min = datetime.datetime.fromisoformat(start_date).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-                    time_max = datetime.datetime.fromisoformat(end_date + "T23:59:59").strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-                    search_params['timeMin'] = time_min
-                    search_params['timeMax'] = time_max
-
-                # Execute search
-                events_result = self.service.events().list(**search_params).execute()
-                events = events_result.get("items", [])
-
-                if not events:
-                    return json.dumps({
-                        "message": f"No events found matching '{query}' in calendar '{calendar_display_name}'"
-                    })
-
-                events_json = json.dumps(events)
-                return self._parse_event(events_json, calendar_display_name)
+            resolved_calendar_id, calendar_display_name = await asyncio.to_thread(self._resolve_calendar, calendar_id)
 
-            else:
-                return json.dumps({"error": "authentication issue"})
+            # Same default window as list_events
+            if date_from is None:
+                date_from = datetime.datetime.now(_UTC).isoformat(timespec="seconds")
 
-        except HttpError as error:
-            logger.error(f"An error occurred during search: {error}")
-            return json.dumps({"error": f"An error occurred during search: {error}"})
+            params = {
+                "timeMin": self._to_rfc3339(date_from),
+                "singleEvents": "true",
+                "orderBy": "startTime",
+                "fields": EVENT_LIST_FIELDS,
+            }
+            # Same paging as _list_events: a single page stops at EVENTS_PAGE_SIZE events
+            events = []
+            while len(events) < limit:
+                params["maxResults"] = min(EVENTS_PAGE_SIZE, limit - len(events))
+                events_result = await self._request(
+                    "GET", f"/calendars/{quote(resolved_calendar_id)}/events", params=params
+                )
+                events.extend(events_result.get("items", []))
+                params["pageToken"] = events_result.get("nextPageToken")
+                if not params["pageToken"]:
+                    break
+            if not events:
+                return f"No upcoming events found in calendar '{calendar_display_name}'."
+
+            return self._parse_event(events, calendar_display_name)
+        except httpx.HTTPError as error:
+            logger.error(f"An error occurred: {error}")
+            return _dumps({"error": f"An error occurred: {error}"})
+        # Authentication, date parsing and decoding failures, reported as calendar_api does for list_events
+        except Exception as e:
+            logger.error(f"Error listing events: {e}")
+            return _dumps({"error": f"Error listing events: {e}"})
+
+    async def create_event_async(
+            self,
+            start_datetime: str,
+            end_datetime: str,
+            title: Optional[str] = None,
+            description: Optional[str] = None,
+            location: Optional[str] = None,
+            calendar_id: str = "primary"
+    ) -> str:
+        """
+        Async variant of create_event.
+
+        Args:
+            start_datetime (str): start date and time of the event
+            end_datetime (str): end date and time of the event
+            title (Optional[str]): Title of the Event
+            description (Optional[str]): Detailed description of the event
+            location (Optional[str]): Location of the event
+            calendar_id (str): ID or name of the calendar to create event in. Defaults to "primary".
+        """
+        try:
+            resolved_calendar_id = await asyncio.to_thread(self._get_calendar_id_by_name, calendar_id)
+            event_result = await self._request(
+                "POST",
+                f"/calendars/{quote(resolved_calendar_id)}/events",
+                params={"fields": EVENT_FIELDS},
+                json=self._build_event_body(start_datetime, end_datetime, title, description, location),
+            )
+            return _dumps(event_result)
+        except httpx.HTTPError as error:
+            logger.error(f"An error occurred: {error}")
+            return _dumps({"error": f"An error occurred: {error}"})
         except Exception as e:
-            logger.error(f"Error searching events: {e}")
-            return json.dumps({"error": f"Error searching events: {e}"})
+            logger.error(f"Error creating event: {e}")
+            return _dumps({"error": f"Error creating event: {e}"})
 
 
 if __name__ == "__main__":
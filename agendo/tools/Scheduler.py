@@ -1,13 +1,85 @@
-import json
+import bisect
 import datetime
+import itertools
 import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Union
+from zoneinfo import ZoneInfo
 
+import orjson
+import parsedatetime
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
 from agno.tools import Toolkit
 from agno.utils.log import logger
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from agendo.sdk.googlecalendar import GoogleCalendarTools
+from agendo.tools._slots import free_slots
+
+
+class EventArgs(BaseModel):
+    """Arguments for one event in bulk_create_events."""
+    start_datetime: datetime.datetime
+    end_datetime: datetime.datetime
+    title: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+
+
+# Python 3.11+ fromisoformat accepts the trailing "Z" freebusy uses for UTC
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime.datetime:
+        return datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+
+# Built once at import so every tool call reuses the compiled pydantic-core validator
+_EVENTS_ADAPTER = TypeAdapter(List[EventArgs])
+
+
+def _dumps(obj) -> str:
+    """Compact UTF-8 JSON for tool results; whitespace would only cost the model tokens."""
+    return orjson.dumps(obj).decode()
+
+
+# list_events results are reused for repeated reads within a turn (e.g. suggest_optimal_times
+# -> find_free_time_blocks -> get_schedule_range); any calendar write invalidates them
+LIST_CACHE_TTL = 30
+LIST_CACHE_SIZE = 256
+
+# Events fetched per name lookup; Google's q= filter already narrows the results server-side,
+# the title match below only ranks them
+SEARCH_RESULTS = 5
+
+# Lookup tables for the natural-language date/time helpers, built once
+_WEEKDAYS = {'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+             'friday': 4, 'saturday': 5, 'sunday': 6}
+# Display names indexed by weekday(); a tuple lookup instead of strftime("%A") per day
+_DAY_NAMES = tuple(name.capitalize() for name in _WEEKDAYS)
+_TIME_MAPPINGS = {
+    "morning": (9, 0), "afternoon": (14, 0),
+    "evening": (18, 0), "noon": (12, 0)
+}
+# Fallback for phrasings the tables above don't cover ("in 3 days", "june 30"); built once
+_PDT_CALENDAR = parsedatetime.Calendar()
+_DATE_PHRASE_RE = re.compile(r"\b(today|tomorrow|next week|" + "|".join(_WEEKDAYS) + ")")
+_TIME_PHRASE_RE = re.compile(r"\b(" + "|".join(_TIME_MAPPINGS) + r")\b")
+# A clock time needs minutes ("14:30") or a meridiem ("2 pm"); bare numbers such as "in 2 hours"
+# are left to parsedatetime
+_CLOCK_TIME_RE = re.compile(r"\b(\d{1,2})(?=:\d{2}|\s*[ap]m\b)(?::(\d{2}))?\s*(am|pm)?\b")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# One term of a duration: "2 hours", "30 min", "1h", "half an hour", "1 day"; a term without a unit is minutes
+_DURATION_TERM_RE = re.compile(
+    r"(?:and\s+)?(?:(\d+(?:\.\d+)?)\s*|(half\s+an?|an?)\s+)(days?|d|hours?|hrs?|h|minutes?|mins?|m)?[\s,]*")
+_DURATION_UNIT_HOURS = {"d": 24, "h": 1, "m": 1 / 60}
+# "2025-06-25 09:00 - 10:00" or "2025-06-25 23:00 - 2025-06-26 01:00", as formatted by the calendar SDK
+_TIME_RANGE_RE = re.compile(r"(\d{4}-\d{2}-\d{2}) (\d{2}:\d{2}) - (?:(\d{4}-\d{2}-\d{2}) )?(\d{2}:\d{2})")
 
 
 class Scheduler(Toolkit):
@@ -19,6 +91,31 @@ class Scheduler(Toolkit):
     recommendations when working with other agents or handling user requests.
     """
 
+    # Agent-facing tools, organized by capability
+    _TOOLS = (
+        # === SCHEDULE READING ===
+        "get_events",
+        "get_tasks",  # Read synced Todoist tasks
+        "get_week_schedule",
+        "get_schedule_range",
+        "list_available_calendars",
+
+        # === EVENT & TASK SCHEDULING ===
+        "find_event_by_name",
+        "move_event_by_name",
+        "create_event_simple",
+        "bulk_create_events",
+        "find_task_by_name",
+        "move_task_by_name",
+
+        # === TIME ANALYSIS & OPTIMIZATION ===
+        "check_availability_simple",
+        "get_busy",
+        "find_slot_round_robin",
+        "find_free_time_blocks",
+        "suggest_optimal_times",
+    )
+
     def __init__(
             self,
             calendar_tools: Optional[GoogleCalendarTools] = None,
@@ -49,211 +146,397 @@ class Scheduler(Toolkit):
             )
 
         self.todoist_calendar = todoist_calendar_name
-
-        # Register Calendar Agent functions - organized by capability
-
-        # === SCHEDULE READING ===
-        self.register(self.get_events)
-        self.register(self.get_tasks)  # Read synced Todoist tasks
-        self.register(self.get_week_schedule)
-        self.register(self.get_schedule_range)
-        self.register(self.list_available_calendars)
-
-        # === EVENT & TASK SCHEDULING ===
-        self.register(self.find_event_by_name)
-        self.register(self.move_event_by_name)
-        self.register(self.create_event_simple)
-        self.register(self.find_task_by_name)
-        self.register(self.move_task_by_name)
-
-        # === TIME ANALYSIS & OPTIMIZATION ===
-        self.register(self.check_availability_simple)
-        self.register(self.find_free_time_blocks)
-        self.register(self.suggest_optimal_times)
+        # Bumped on every calendar write so callers can invalidate cached reads
+        self.write_epoch = 0
+        # Long-lived pool for concurrent list_events calls; its threads keep their
+        # own Google API connections alive between tool calls
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="scheduler")
+        self._list_cache: "OrderedDict[tuple, tuple[float, str]]" = OrderedDict()
+        self._list_cache_lock = threading.Lock()
+        self._now_cache: Optional[tuple] = None
+        self._busy_index_cache: Optional[tuple] = None
+
+        # Register Calendar Agent functions; agno keeps each bound method as the Function's
+        # entrypoint, so calls dispatch straight to it without another attribute lookup
+        for name in self._TOOLS:
+            self.register(getattr(self, name))
+
+    def _now(self) -> datetime.datetime:
+        """Local time, read from the clock at most once a second so a tool call and its helpers share it."""
+        now = time.monotonic()
+        if self._now_cache is None or now - self._now_cache[0] >= 1.0:
+            self._now_cache = (now, datetime.datetime.now())
+        return self._now_cache[1]
+
+    def _today(self) -> datetime.date:
+        """Today's date, from the same snapshot as _now."""
+        return self._now().date()
 
     def _parse_human_date(self, date_input: str) -> str:
         """Helper to parse human-friendly dates into ISO format."""
         try:
             date_input = date_input.lower().strip()
-            today = datetime.date.today()
+            today = self._today()
 
             # Direct ISO format
             if len(date_input) == 10 and "-" in date_input:
                 return date_input
 
-            # Common phrases
-            if date_input in ["today"]:
+            # Common phrases and weekdays, found in one scan
+            match = _DATE_PHRASE_RE.search(date_input)
+            if match is None:
+                parsed, flags = _PDT_CALENDAR.parseDT(date_input, sourceTime=self._now())
+                return parsed.date().isoformat() if flags & 1 else today.isoformat()
+
+            phrase = match.group(1)
+            if phrase == "today":
                 return today.isoformat()
-            elif date_input in ["tomorrow"]:
+            elif phrase == "tomorrow":
                 return (today + datetime.timedelta(days=1)).isoformat()
-            elif "next week" in date_input:
+            elif phrase == "next week":
                 return (today + datetime.timedelta(days=7)).isoformat()
 
-            # Weekdays
-            weekdays = {'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-                        'friday': 4, 'saturday': 5, 'sunday': 6}
-
-            for day_name, day_num in weekdays.items():
-                if day_name in date_input:
-                    days_ahead = day_num - today.weekday()
-                    if days_ahead <= 0: days_ahead += 7
-                    return (today + datetime.timedelta(days=days_ahead)).isoformat()
-
-            return today.isoformat()
+            days_ahead = _WEEKDAYS[phrase] - today.weekday()
+            if days_ahead <= 0: days_ahead += 7
+            return (today + datetime.timedelta(days=days_ahead)).isoformat()
         except:
-            return datetime.date.today().isoformat()
+            return self._today().isoformat()
 
     def _parse_human_time(self, time_input: str, date: str) -> tuple:
-        """Helper to parse human-friendly times into ISO datetime format."""
+        """Helper to parse human-friendly times into (start, end) naive datetimes on the given ISO date."""
+        day = datetime.date.fromisoformat(date)
         try:
             time_input = time_input.lower().strip()
 
             # Default times for vague inputs
-            time_mappings = {
-                "morning": "09:00:00", "afternoon": "14:00:00",
-                "evening": "18:00:00", "noon": "12:00:00"
-            }
-
-            start_time = None
-            for phrase, time in time_mappings.items():
-                if phrase in time_input:
-                    start_time = time
-                    break
-
-            if not start_time:
+            match = _TIME_PHRASE_RE.search(time_input)
+            if match is not None:
+                hour, minute = _TIME_MAPPINGS[match.group(1)]
+            else:
                 # Parse specific times like "2 PM", "14:30"
-                if "pm" in time_input or "am" in time_input:
-                    time_part = time_input.replace("pm", "").replace("am", "").strip()
-                    hour = int(time_part.split(":")[0] if ":" in time_part else time_part)
-                    minute = time_part.split(":")[1] if ":" in time_part else "00"
+                match = _CLOCK_TIME_RE.search(time_input)
+                if match is None:
+                    parsed, flags = _PDT_CALENDAR.parseDT(time_input, sourceTime=self._now())
+                    hour, minute = (parsed.hour, parsed.minute) if flags & 2 else (9, 0)  # Default
+                else:
+                    hour, minute, meridiem = int(match.group(1)), int(match.group(2) or 0), match.group(3)
 
-                    if "pm" in time_input and hour != 12:
+                    if meridiem == "pm" and hour != 12:
                         hour += 12
-                    elif "am" in time_input and hour == 12:
+                    elif meridiem == "am" and hour == 12:
                         hour = 0
 
-                    start_time = f"{hour:02d}:{minute}:00"
-                elif ":" in time_input:
-                    start_time = f"{time_input}:00"
-                else:
-                    start_time = "09:00:00"  # Default
-
             # Default 1 hour duration
-            start_hour = int(start_time.split(":")[0])
-            end_hour = min(start_hour + 1, 23)
-            end_time = f"{end_hour:02d}:{start_time.split(':')[1]}:00"
-
-            return f"{date}T{start_time}", f"{date}T{end_time}"
+            return (datetime.datetime.combine(day, datetime.time(hour, minute)),
+                    datetime.datetime.combine(day, datetime.time(min(hour + 1, 23), minute)))
         except:
-            return f"{date}T09:00:00", f"{date}T10:00:00"
+            return (datetime.datetime.combine(day, datetime.time(9)),
+                    datetime.datetime.combine(day, datetime.time(10)))
+
+    @staticmethod
+    def _by_day(items: list) -> dict:
+        """Index items under every ISO date shown in their "time" field, so per-day lookups are O(1)."""
+        by_day = {}
+        for item in items:
+            for date_str in dict.fromkeys(_ISO_DATE_RE.findall(item.get("time", ""))):
+                by_day.setdefault(date_str, []).append(item)
+        return by_day
+
+    @staticmethod
+    def _start_key(item: dict) -> str:
+        """
+        Chronological sort key: the item's start as "YYYY-MM-DD HH:MM", or just the date for all-day items.
+
+        Sorting on the raw "time" field put every all-day item after all timed ones ("A" > "2").
+        """
+        time_str = item.get("time", "")
+        if time_str.startswith("All day"):
+            match = _ISO_DATE_RE.search(time_str)
+            return match.group() if match else time_str
+        return time_str[:16]
+
+    @staticmethod
+    def _parse_time_range(time_str: str) -> Optional[tuple]:
+        """(start, end) naive datetimes of a timed item's "time" field; None for all-day or unparseable items."""
+        match = _TIME_RANGE_RE.fullmatch(time_str)
+        if match is None:
+            return None
+        start_day, start_hm, end_day, end_hm = match.groups()
+        return (datetime.datetime.fromisoformat(f"{start_day}T{start_hm}"),
+                datetime.datetime.fromisoformat(f"{end_day or start_day}T{end_hm}"))
+
+    @staticmethod
+    def _parse_duration(duration: str) -> float:
+        """Hours in a duration such as "2 hours", "90 min", "1h30" or "half an hour"; a bare number is minutes."""
+        text = duration.lower().strip()
+        hours = 0.0
+        pos = 0
+        while pos < len(text):
+            match = _DURATION_TERM_RE.match(text, pos)
+            if match is None:
+                raise ValueError(f"unrecognised duration '{duration}'")
+            number, article, unit = match.groups()
+            if number is not None:
+                value = float(number)
+            elif unit:
+                value = 0.5 if article.startswith("half") else 1
+            else:
+                raise ValueError(f"unrecognised duration '{duration}'")
+            hours += value * _DURATION_UNIT_HOURS[unit[0] if unit else "m"]
+            pos = match.end()
+        if hours <= 0:
+            raise ValueError(f"duration '{duration}' must be positive")
+        return hours
+
+    @staticmethod
+    def _format_time_range(start: datetime.datetime, end: datetime.datetime) -> str:
+        """Inverse of _parse_time_range: the calendar SDK's "YYYY-MM-DD HH:MM - HH:MM" form."""
+        end_fmt = "%H:%M" if start.date() == end.date() else "%Y-%m-%d %H:%M"
+        return f"{start:%Y-%m-%d %H:%M} - {end.strftime(end_fmt)}"
+
+    @staticmethod
+    def _match_by_title(items: list, name: str) -> list:
+        """Case-insensitive title match in one pass: every exact match, else every partial match."""
+        needle = name.casefold()
+        exact_matches = []
+        partial_matches = []
+        for item in items:
+            title = item.get("title", "").casefold()
+            if title == needle:
+                exact_matches.append(item)
+            elif needle in title:
+                partial_matches.append(item)
+        return exact_matches or partial_matches
+
+    @staticmethod
+    def _to_utc(value: str) -> datetime.datetime:
+        """Parse an ISO date/datetime string as an aware datetime (naive values are treated as UTC)."""
+        dt = _parse_iso(value)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+        return dt
+
+    # Invert sorted busy intervals into the free gaps of a window; see agendo/tools/_slots.py
+    _free_slots = staticmethod(free_slots)
+
+    def _cached_list_events(self, **query) -> str:
+        """list_events behind a short-lived LRU cache keyed on its arguments and the write epoch."""
+        key = (self.write_epoch, *sorted(query.items()))
+        with self._list_cache_lock:
+            entry = self._list_cache.get(key)
+            if entry is not None:
+                if time.monotonic() - entry[0] < LIST_CACHE_TTL:
+                    self._list_cache.move_to_end(key)
+                    return entry[1]
+                del self._list_cache[key]
+
+        result = self.calendar_tools.list_events(**query)
+
+        # Errors are not cached so the next call retries
+        if not result.startswith('{"error"'):
+            with self._list_cache_lock:
+                self._list_cache[key] = (time.monotonic(), result)
+                self._list_cache.move_to_end(key)
+                if len(self._list_cache) > LIST_CACHE_SIZE:
+                    self._list_cache.popitem(last=False)
+        return result
+
+    def _list_events_many(self, queries: list) -> list:
+        """Run list_events for each dict of keyword arguments concurrently; results keep the query order."""
+        return list(self._executor.map(lambda query: self._cached_list_events(**query), queries))
+
+    def _list_range(self, start: datetime.date, end: datetime.date, include_tasks: bool) -> tuple:
+        """
+        Fetch [start, end] with one bounded query per calendar instead of one per day.
+
+        Returns:
+            Tuple of (events, tasks) lists; either is empty when the calendar has nothing or errored
+        """
+        calendars = ["primary", self.todoist_calendar] if include_tasks else ["primary"]
+        days = (end - start).days + 1
+        results = self._list_events_many([
+            {"limit": 50 * days, "date_from": start.isoformat(),
+             "date_to": (end + datetime.timedelta(days=1)).isoformat(), "calendar_id": calendar_id}
+            for calendar_id in calendars
+        ])
+
+        items = []
+        for items_json in results:
+            if "error" in items_json or "No upcoming events" in items_json:
+                items.append([])
+            else:
+                items.append(orjson.loads(items_json))
+        if not include_tasks:
+            items.append([])
+        return items[0], items[1]
+
+    @staticmethod
+    def _localize(value: datetime.datetime, zone: Optional[datetime.tzinfo]) -> datetime.datetime:
+        """Attach zone to a naive wall-clock datetime (the system's local zone when None, DST included)."""
+        return value.replace(tzinfo=zone) if zone is not None else value.astimezone()
+
+    def _busy_index(self, start: datetime.date, end: datetime.date,
+                    zone: Optional[datetime.tzinfo] = None) -> dict:
+        """
+        Busy intervals of the primary and Todoist calendars in [start, end], from one freebusy query,
+        indexed by ISO date and sorted by start for bisect lookups.
+
+        Dates and times are naive wall-clock times in zone (the system's local zone when None), the
+        same form _parse_human_time returns. The index is reused until the list cache would expire or
+        a write bumps the epoch, so repeated availability checks skip the request.
+
+        Returns:
+            Dict of date -> (starts, intervals), where intervals are (start, end, type) tuples
+            (type is "event" or "task") and starts holds their start datetimes in the same order
+
+        Raises:
+            RuntimeError: freebusy failed or could not read one of the calendars
+        """
+        key = (start, end, zone, self.write_epoch)
+        cached = self._busy_index_cache
+        if cached is not None and cached[0] == key and time.monotonic() - cached[1] < LIST_CACHE_TTL:
+            return cached[2]
+
+        # The window runs from local midnight to local midnight, sent with its UTC offset
+        combine = datetime.datetime.combine
+        midnight = datetime.time()
+        one_day = datetime.timedelta(days=1)
+        free_busy = orjson.loads(self.calendar_tools.query_free_busy(
+            self._localize(combine(start, midnight), zone).isoformat(),
+            self._localize(combine(end + one_day, midnight), zone).isoformat(),
+            ["primary", self.todoist_calendar]))
+        if "error" in free_busy:
+            raise RuntimeError(free_busy["error"])
+        # An unreadable calendar has no busy list; treating it as free would report false availability
+        if free_busy["errors"]:
+            raise RuntimeError("could not read " + ", ".join(
+                f"{calendar} ({', '.join(error.get('reason', 'unknown') for error in errors)})"
+                for calendar, errors in free_busy["errors"].items()))
+        busy_by_calendar = free_busy["busy"]
+
+        # Bound once: this loop runs per busy interval and per day it spans
+        by_day = {}
+        add_day = by_day.setdefault
+        to_utc = self._to_utc
+        for calendar, intervals in busy_by_calendar.items():
+            item_type = "task" if calendar == self.todoist_calendar else "event"
+            for b in intervals:
+                # freebusy answers in UTC; astimezone(None) is the system's local zone
+                busy_start = to_utc(b["start"]).astimezone(zone).replace(tzinfo=None)
+                busy_end = to_utc(b["end"]).astimezone(zone).replace(tzinfo=None)
+                interval = (busy_start, busy_end, item_type)
+                # Indexed under every day the interval touches; an interval ending at midnight doesn't touch the next day
+                day = busy_start.date()
+                while True:
+                    add_day(day.isoformat(), []).append(interval)
+                    day += one_day
+                    if combine(day, midnight) >= busy_end:
+                        break
+
+        index = {}
+        for date_str, intervals in by_day.items():
+            intervals.sort()
+            index[date_str] = ([interval[0] for interval in intervals], intervals)
+
+        self._busy_index_cache = (key, time.monotonic(), index)
+        return index
 
     # =================== SCHEDULE READING ===================
 
-    def get_events(self, limit: int = 10, date_from: str = datetime.date.today().isoformat()) -> str:
-        """Get calendar events from primary calendar (excludes Todoist tasks)."""
+    def get_events(self, limit: int = 10, date_from: Optional[str] = None) -> str:
+        """Get calendar events from primary calendar (excludes Todoist tasks). date_from defaults to today."""
+        # Resolved per call: a default in the signature would be frozen at import time
+        if date_from is None:
+            date_from = self._today().isoformat()
         try:
-            events_json = self.calendar_tools.list_events(limit=limit, date_from=date_from, calendar_id="primary")
+            events_json = self._cached_list_events(limit=limit, date_from=date_from, calendar_id="primary")
             if "No upcoming events" in events_json or "error" in events_json:
                 return events_json
 
-            events = json.loads(events_json)
+            events = orjson.loads(events_json)
             if isinstance(events, list):
                 for event in events:
                     event["item_type"] = "event"
-            return json.dumps(events, ensure_ascii=False, indent=2)
+            return _dumps(events)
         except Exception as e:
             logger.error(f"Error getting events: {e}")
-            return json.dumps({"error": f"Error getting events: {e}"})
+            return _dumps({"error": f"Error getting events: {e}"})
 
-    def get_tasks(self, limit: int = 10, date_from: str = datetime.date.today().isoformat()) -> str:
-        """Get Todoist tasks synced to calendar for unified schedule view."""
+    def get_tasks(self, limit: int = 10, date_from: Optional[str] = None) -> str:
+        """Get Todoist tasks synced to calendar for unified schedule view. date_from defaults to today."""
+        if date_from is None:
+            date_from = self._today().isoformat()
         try:
-            tasks_json = self.calendar_tools.list_events(limit=limit, date_from=date_from,
-                                                         calendar_id=self.todoist_calendar)
+            tasks_json = self._cached_list_events(limit=limit, date_from=date_from,
+                                                  calendar_id=self.todoist_calendar)
             if "No upcoming events" in tasks_json or "error" in tasks_json:
                 return tasks_json
 
-            tasks = json.loads(tasks_json)
+            tasks = orjson.loads(tasks_json)
             for task in tasks:
                 task["item_type"] = "task"
                 description = task.get("description", "")
                 if "todoist.com/app/task/" in description:
                     task["todoist_url"] = description.strip()
-            return json.dumps(tasks, ensure_ascii=False, indent=2)
+            return _dumps(tasks)
         except Exception as e:
             logger.error(f"Error getting tasks: {e}")
-            return json.dumps({"error": f"Error getting tasks: {e}"})
+            return _dumps({"error": f"Error getting tasks: {e}"})
 
-    def get_week_schedule(self, start_date: str = datetime.date.today().isoformat(), include_tasks: bool = True) -> str:
-        """Get unified weekly schedule including events and synced tasks."""
+    def get_week_schedule(self, start_date: Optional[str] = None, include_tasks: bool = True) -> str:
+        """Get unified weekly schedule including events and synced tasks. start_date defaults to today."""
+        if start_date is None:
+            start_date = self._today().isoformat()
         try:
             start = datetime.datetime.fromisoformat(start_date).date()
             week_schedule = {}
 
+            # The whole week in one request per calendar, bucketed into days locally
+            events, tasks = self._list_range(start, start + datetime.timedelta(days=6), include_tasks)
+            events_by_day, tasks_by_day = self._by_day(events), self._by_day(tasks)
+
             for day_offset in range(7):
                 current_date = start + datetime.timedelta(days=day_offset)
                 date_str = current_date.isoformat()
-                day_name = current_date.strftime("%A")
+                day_name = _DAY_NAMES[current_date.weekday()]
 
-                day_data = {"date": date_str, "day_name": day_name, "events": [], "tasks": []}
-
-                # Get events
-                events_json = self.calendar_tools.list_events(limit=50, date_from=date_str, calendar_id="primary")
-                if not ("error" in events_json or "No upcoming events" in events_json):
-                    events = json.loads(events_json)
-                    day_data["events"] = [e for e in events if date_str in e.get("time", "")]
-
-                # Get tasks if requested
-                if include_tasks:
-                    tasks_json = self.calendar_tools.list_events(limit=50, date_from=date_str,
-                                                                 calendar_id=self.todoist_calendar)
-                    if not ("error" in tasks_json or "No upcoming events" in tasks_json):
-                        tasks = json.loads(tasks_json)
-                        day_data["tasks"] = [t for t in tasks if date_str in t.get("time", "")]
+                day_data = {
+                    "date": date_str, "day_name": day_name,
+                    "events": events_by_day.get(date_str, []),
+                    "tasks": tasks_by_day.get(date_str, [])
+                }
 
                 week_schedule[date_str] = day_data
 
-            return json.dumps(week_schedule, ensure_ascii=False, indent=2)
+            return _dumps(week_schedule)
         except Exception as e:
             logger.error(f"Error getting week schedule: {e}")
-            return json.dumps({"error": f"Error getting week schedule: {e}"})
+            return _dumps({"error": f"Error getting week schedule: {e}"})
 
-    def get_schedule_range(self, start_date: str, end_date: str, include_tasks: bool = True) -> str:
-        """Get schedule for custom date range - flexible scheduling analysis."""
-        try:
-            start = datetime.datetime.fromisoformat(start_date).date()
-            end = datetime.datetime.fromisoformat(end_date).date()
+    def _get_schedule_range(self, start_date: str, end_date: str, include_tasks: bool = True) -> Union[list, dict]:
+        """get_schedule_range as Python objects: the sorted item list, or an error dict."""
+        start = datetime.datetime.fromisoformat(start_date).date()
+        end = datetime.datetime.fromisoformat(end_date).date()
 
-            if start > end:
-                return json.dumps({"error": "Start date must be before or equal to end date"})
+        if start > end:
+            return {"error": "Start date must be before or equal to end date"}
 
-            range_schedule = []
-            current_date = start
+        # The whole range in one request per calendar; one pass keeps the items shown on a day in range
+        events, tasks = self._list_range(start, end, include_tasks)
+        dates = frozenset((start + datetime.timedelta(days=i)).isoformat() for i in range((end - start).days + 1))
+        range_schedule = [item for item in itertools.chain(events, tasks)
+                          if not dates.isdisjoint(_ISO_DATE_RE.findall(item.get("time", "")))]
 
-            while current_date <= end:
-                date_str = current_date.isoformat()
+        range_schedule.sort(key=self._start_key)
+        return range_schedule
 
-                # Get events
-                events_json = self.calendar_tools.list_events(limit=50, date_from=date_str, calendar_id="primary")
-                if not ("error" in events_json or "No upcoming events" in events_json):
-                    events = json.loads(events_json)
-                    range_schedule.extend([e for e in events if date_str in e.get("time", "")])
-
-                # Get tasks if requested
-                if include_tasks:
-                    tasks_json = self.calendar_tools.list_events(limit=50, date_from=date_str,
-                                                                 calendar_id=self.todoist_calendar)
-                    if not ("error" in tasks_json or "No upcoming events" in tasks_json):
-                        tasks = json.loads(tasks_json)
-                        range_schedule.extend([t for t in tasks if date_str in t.get("time", "")])
-
-                current_date += datetime.timedelta(days=1)
-
-            range_schedule.sort(key=lambda x: x.get("time", ""))
-            return json.dumps(range_schedule, ensure_ascii=False, indent=2)
+    def get_schedule_range(self, start_date: str, end_date: str, include_tasks: bool = True) -> str:
+        """Get schedule for custom date range - flexible scheduling analysis."""
+        try:
+            return _dumps(self._get_schedule_range(start_date, end_date, include_tasks))
         except Exception as e:
             logger.error(f"Error getting schedule range: {e}")
-            return json.dumps({"error": f"Error getting schedule range: {e}"})
+            return _dumps({"error": f"Error getting schedule range: {e}"})
 
     def list_available_calendars(self) -> str:
         """List available calendars for calendar management."""
@@ -261,264 +544,392 @@ class Scheduler(Toolkit):
             return self.calendar_tools.list_calendars()
         except Exception as e:
             logger.error(f"Error listing calendars: {e}")
-            return json.dumps({"error": f"Error listing calendars: {e}"})
+            return _dumps({"error": f"Error listing calendars: {e}"})
 
     # =================== EVENT & TASK SCHEDULING ===================
 
-    def find_event_by_name(self, event_name: str) -> str:
-        """Find events by name - allows natural language event references instead of requiring exact IDs."""
+    def _find_event_by_name(self, event_name: str) -> dict:
+        """find_event_by_name as a dict, for callers that act on the match."""
         try:
-            search_result = self.calendar_tools.search_events(query=event_name, calendar_id="primary", max_results=10)
-            if "error" in search_result:
-                return search_result
+            events = orjson.loads(
+                self.calendar_tools.search_events(query=event_name, calendar_id="primary", max_results=SEARCH_RESULTS)
+            )
+            if isinstance(events, dict) and "error" in events:
+                return events
 
-            events = json.loads(search_result)
             if not events or (isinstance(events, dict) and "message" in events):
-                return json.dumps({"found": False, "error": f"No events found matching '{event_name}'"})
+                return {"found": False, "error": f"No events found matching '{event_name}'"}
 
             # Find best matches
-            exact_matches = [e for e in events if event_name.lower() == e.get("title", "").lower()]
-            partial_matches = [e for e in events if event_name.lower() in e.get("title", "").lower()]
-            matches = exact_matches if exact_matches else partial_matches
+            matches = self._match_by_title(events, event_name)
 
             if len(matches) == 1:
                 event = matches[0]
-                return json.dumps({
+                return {
                     "found": True, "event_id": event.get("id"), "title": event.get("title"),
                     "time": event.get("time"), "location": event.get("location", "")
-                })
+                }
             elif len(matches) > 1:
-                return json.dumps({
+                return {
                     "found": False, "multiple_matches": True, "count": len(matches),
                     "events": [{"event_id": e.get("id"), "title": e.get("title"), "time": e.get("time")} for e in
                                matches]
-                })
+                }
             else:
-                return json.dumps({"found": False, "error": f"No events found matching '{event_name}'"})
+                return {"found": False, "error": f"No events found matching '{event_name}'"}
         except Exception as e:
-            return json.dumps({"found": False, "error": f"Error finding event: {e}"})
+            return {"found": False, "error": f"Error finding event: {e}"}
+
+    def find_event_by_name(self, event_name: str) -> str:
+        """Find events by name - allows natural language event references instead of requiring exact IDs."""
+        return _dumps(self._find_event_by_name(event_name))
 
     def move_event_by_name(self, event_name: str, new_date: str, new_time: str = "morning") -> str:
         """Move events using natural language dates and times."""
         try:
             # Find the event
-            find_result = self.find_event_by_name(event_name)
-            find_data = json.loads(find_result)
+            find_data = self._find_event_by_name(event_name)
 
             if not find_data.get("found"):
-                return find_result
+                return _dumps(find_data)
 
             # Parse human-friendly date/time
             parsed_date = self._parse_human_date(new_date)
-            start_datetime, end_datetime = self._parse_human_time(new_time, parsed_date)
+            start_dt, end_dt = self._parse_human_time(new_time, parsed_date)
 
             # Update the event
             result = self.calendar_tools.update_event(
                 event_id=find_data["event_id"], calendar_id="primary",
-                start_datetime=start_datetime, end_datetime=end_datetime
+                start_datetime=start_dt.isoformat(timespec="seconds"), end_datetime=end_dt.isoformat(timespec="seconds")
             )
+            self.write_epoch += 1
 
-            return json.dumps({
+            return _dumps({
                 "success": True, "event_name": event_name, "new_date": parsed_date,
                 "new_time": new_time, "message": f"Event '{event_name}' moved to {parsed_date} at {new_time}"
             })
         except Exception as e:
-            return json.dumps({"success": False, "error": f"Error moving event: {e}"})
+            return _dumps({"success": False, "error": f"Error moving event: {e}"})
 
     def create_event_simple(self, title: str, date: str, time: str = "morning",
-                            duration: str = "1 hour", description: str = None, location: str = None) -> str:
-        """Create events with natural language inputs for user-friendly scheduling."""
+                            duration: str = "1 hour", description: Optional[str] = None, location: Optional[str] = None) -> str:
+        """Create events with natural language inputs for user-friendly scheduling.
+
+        duration is in days, hours and/or minutes ("2 hours", "90 min", "1h30", "half an hour"); a bare
+        number is minutes. A duration that can't be parsed is rejected rather than defaulted.
+        """
         try:
             parsed_date = self._parse_human_date(date)
-            start_datetime, default_end = self._parse_human_time(time, parsed_date)
-
-            # Parse duration
-            hours = 1  # default
-            if "hour" in duration.lower():
-                if "2" in duration:
-                    hours = 2
-                elif "3" in duration:
-                    hours = 3
-                elif "30 min" in duration or "half" in duration:
-                    hours = 0.5
-            elif "30" in duration:
-                hours = 0.5
-
-            # Calculate end time
-            start_dt = datetime.datetime.fromisoformat(start_datetime)
-            end_dt = start_dt + datetime.timedelta(hours=hours)
-            end_datetime = end_dt.strftime("%Y-%m-%dT%H:%M:%S")
+            start_dt, _ = self._parse_human_time(time, parsed_date)
+            hours = self._parse_duration(duration)
+
+            # Calculate end time; each datetime is formatted exactly once
+            start_datetime = start_dt.isoformat(timespec="seconds")
+            end_datetime = (start_dt + datetime.timedelta(hours=hours)).isoformat(timespec="seconds")
 
             result = self.calendar_tools.create_event(
                 start_datetime=start_datetime, end_datetime=end_datetime,
                 title=title, description=description, location=location, calendar_id="primary"
             )
+            self.write_epoch += 1
 
-            return json.dumps({
+            return _dumps({
                 "success": True, "title": title, "date": parsed_date, "time": time,
                 "start_datetime": start_datetime, "end_datetime": end_datetime,
                 "message": f"Event '{title}' created for {parsed_date} at {time}"
             })
         except Exception as e:
-            return json.dumps({"success": False, "error": f"Error creating event: {e}"})
+            return _dumps({"success": False, "error": f"Error creating event: {e}"})
+
+    def bulk_create_events(self, events: List[dict]) -> str:
+        """Create several events in one request - use instead of repeated create_event_simple calls.
+
+        Each event needs "start_datetime" and "end_datetime" in ISO format and may set "title",
+        "description" and "location".
+        """
+        try:
+            parsed_events = _EVENTS_ADAPTER.validate_python(events)
+        except ValidationError as e:
+            return _dumps({"success": False, "error": f"Invalid events: {e}"})
 
-    def find_task_by_name(self, task_name: str) -> str:
-        """Find Todoist tasks by name - enables natural language task references."""
         try:
-            search_result = self.calendar_tools.search_events(query=task_name, calendar_id=self.todoist_calendar,
-                                                              max_results=10)
-            if "error" in search_result:
-                return search_result
+            self.write_epoch += 1
+            return self.calendar_tools.create_events(events=[
+                {
+                    "title": event.title, "description": event.description, "location": event.location,
+                    "start_datetime": event.start_datetime.isoformat(),
+                    "end_datetime": event.end_datetime.isoformat()
+                }
+                for event in parsed_events
+            ], calendar_id="primary")
+        except Exception as e:
+            return _dumps({"success": False, "error": f"Error creating events: {e}"})
+
+    def _find_task_by_name(self, task_name: str) -> dict:
+        """find_task_by_name as a dict, for callers that act on the match."""
+        try:
+            tasks = orjson.loads(
+                self.calendar_tools.search_events(query=task_name, calendar_id=self.todoist_calendar,
+                                                  max_results=SEARCH_RESULTS)
+            )
+            if isinstance(tasks, dict) and "error" in tasks:
+                return tasks
 
-            tasks = json.loads(search_result)
             if not tasks or (isinstance(tasks, dict) and "message" in tasks):
-                return json.dumps({"found": False, "error": f"No tasks found matching '{task_name}'"})
+                return {"found": False, "error": f"No tasks found matching '{task_name}'"}
 
             # Find best matches
-            exact_matches = [t for t in tasks if task_name.lower() == t.get("title", "").lower()]
-            partial_matches = [t for t in tasks if task_name.lower() in t.get("title", "").lower()]
-            matches = exact_matches if exact_matches else partial_matches
+            matches = self._match_by_title(tasks, task_name)
 
             if len(matches) == 1:
                 task = matches[0]
-                return json.dumps({
+                return {
                     "found": True, "task_id": task.get("id"), "title": task.get("title"),
                     "time": task.get("time"), "description": task.get("description", ""),
                     "todoist_url": task.get("todoist_url", "")
-                })
+                }
             elif len(matches) > 1:
-                return json.dumps({
+                return {
                     "found": False, "multiple_matches": True, "count": len(matches),
                     "tasks": [{"task_id": t.get("id"), "title": t.get("title"), "time": t.get("time")} for t in matches]
-                })
+                }
             else:
-                return json.dumps({"found": False, "error": f"No tasks found matching '{task_name}'"})
+                return {"found": False, "error": f"No tasks found matching '{task_name}'"}
         except Exception as e:
-            return json.dumps({"found": False, "error": f"Error finding task: {e}"})
+            return {"found": False, "error": f"Error finding task: {e}"}
+
+    def find_task_by_name(self, task_name: str) -> str:
+        """Find Todoist tasks by name - enables natural language task references."""
+        return _dumps(self._find_task_by_name(task_name))
 
     def move_task_by_name(self, task_name: str, new_date: str, new_time: str = "morning") -> str:
         """Move Todoist tasks using natural language - Calendar Agent's scheduling authority."""
         try:
             # Find the task
-            find_result = self.find_task_by_name(task_name)
-            find_data = json.loads(find_result)
+            find_data = self._find_task_by_name(task_name)
 
             if not find_data.get("found"):
-                return find_result
+                return _dumps(find_data)
 
             # Parse human-friendly date/time
             parsed_date = self._parse_human_date(new_date)
-            start_datetime, end_datetime = self._parse_human_time(new_time, parsed_date)
+            start_dt, end_dt = self._parse_human_time(new_time, parsed_date)
 
             # Update the task in Todoist calendar (bidirectional sync will update Todoist)
             result = self.calendar_tools.update_event(
                 event_id=find_data["task_id"], calendar_id=self.todoist_calendar,
-                start_datetime=start_datetime, end_datetime=end_datetime
+                start_datetime=start_dt.isoformat(timespec="seconds"), end_datetime=end_dt.isoformat(timespec="seconds")
             )
+            self.write_epoch += 1
 
-            return json.dumps({
+            return _dumps({
                 "success": True, "task_name": task_name, "new_date": parsed_date,
                 "new_time": new_time, "message": f"Task '{task_name}' rescheduled to {parsed_date} at {new_time}",
                 "note": "Change will sync back to Todoist automatically"
             })
         except Exception as e:
-            return json.dumps({"success": False, "error": f"Error moving task: {e}"})
+            return _dumps({"success": False, "error": f"Error moving task: {e}"})
 
     # =================== TIME ANALYSIS & OPTIMIZATION ===================
 
-    def check_availability_simple(self, date: str, time: str = "morning") -> str:
-        """Quick availability check using natural language inputs."""
+    def check_availability_simple(self, date: str, time: str = "morning", tz: Optional[str] = None) -> str:
+        """Quick availability check using natural language inputs.
+
+        time is read on the wall clock of tz, an IANA name such as "Europe/Berlin" (the system's local zone by default).
+        """
         try:
             parsed_date = self._parse_human_date(date)
+            slot_start, slot_end = self._parse_human_time(time, parsed_date)
 
-            # Get day's events and tasks
-            events_json = self.calendar_tools.list_events(limit=50, date_from=parsed_date, calendar_id="primary")
-            tasks_json = self.calendar_tools.list_events(limit=50, date_from=parsed_date,
-                                                         calendar_id=self.todoist_calendar)
+            # Only the day's busy intervals that start before the slot ends can overlap it
+            day = datetime.date.fromisoformat(parsed_date)
+            starts, intervals = self._busy_index(day, day, ZoneInfo(tz) if tz else None).get(parsed_date, ((), ()))
+            busy = [(start, end, item_type) for start, end, item_type in intervals[:bisect.bisect_left(starts, slot_end)]
+                    if end > slot_start]
 
             conflicts = []
-
-            # Check events
-            if not ("error" in events_json or "No upcoming events" in events_json):
-                events = json.loads(events_json)
-                conflicts.extend([{"type": "event", "title": e.get("title"), "time": e.get("time")}
-                                  for e in events if
-                                  parsed_date in e.get("time", "") and "All day" not in e.get("time", "")])
-
-            # Check tasks
-            if not ("error" in tasks_json or "No upcoming events" in tasks_json):
-                tasks = json.loads(tasks_json)
-                conflicts.extend([{"type": "task", "title": t.get("title"), "time": t.get("time")}
-                                  for t in tasks if
-                                  parsed_date in t.get("time", "") and "All day" not in t.get("time", "")])
-
-            return json.dumps({
+            if busy:
+                # freebusy carries no titles; name the conflicts from the day's (cached) listings
+                events, tasks = self._list_range(day, day, include_tasks=True)
+                for item_type, items in (("event", events), ("task", tasks)):
+                    for item in items:
+                        interval = self._parse_time_range(item.get("time", ""))
+                        if interval is not None and interval[0] < slot_end and interval[1] > slot_start:
+                            conflicts.append({"type": item_type, "title": item.get("title"), "time": item.get("time")})
+                # Busy time the listings don't show (e.g. an item that started the day before) is still reported
+                if not conflicts:
+                    conflicts = [{"type": item_type, "title": None, "time": self._format_time_range(start, end)}
+                                 for start, end, item_type in busy]
+
+            return _dumps({
                 "date": parsed_date, "requested_time": time, "available": len(conflicts) == 0,
                 "conflicts_count": len(conflicts), "conflicts": conflicts,
                 "message": f"{'Available' if len(conflicts) == 0 else 'Busy'} on {parsed_date} during {time}"
             })
         except Exception as e:
-            return json.dumps({"error": f"Error checking availability: {e}"})
+            return _dumps({"error": f"Error checking availability: {e}"})
 
-    def find_free_time_blocks(self, hours_needed: float, date_range: tuple = None,
-                              working_hours: tuple = (9, 17)) -> str:
-        """Find available time blocks for scheduling - core scheduling intelligence."""
+    def get_busy(self, time_min: str, time_max: str, calendar_ids: Optional[List[str]] = None) -> str:
+        """Busy and free intervals across calendars from one freebusy query - preferred availability check.
+
+        time_min/time_max are ISO datetimes (or dates); calendar_ids defaults to the primary and Todoist calendars.
+        Calendars that could not be read are listed under "errors" and left out of "free".
+        """
+        try:
+            if calendar_ids is None:
+                calendar_ids = ["primary", self.todoist_calendar]
+
+            free_busy = orjson.loads(self.calendar_tools.query_free_busy(time_min, time_max, calendar_ids))
+            if "error" in free_busy:
+                return _dumps(free_busy)
+
+            busy_by_calendar = free_busy["busy"]
+            busy = sorted((self._to_utc(b["start"]), self._to_utc(b["end"]))
+                          for intervals in busy_by_calendar.values() for b in intervals)
+            free = self._free_slots(busy, self._to_utc(time_min), self._to_utc(time_max))
+
+            return _dumps({
+                "time_min": time_min, "time_max": time_max, "busy": busy_by_calendar,
+                "free": [{"start": start.isoformat(), "end": end.isoformat()} for start, end in free],
+                "errors": free_busy["errors"]
+            })
+        except Exception as e:
+            return _dumps({"error": f"Error getting busy times: {e}"})
+
+    def find_slot_round_robin(self, calendar_ids: List[str], time_min: str, time_max: str,
+                              duration_minutes: int = 30) -> str:
+        """Find the earliest slot where any one of several people is free (round-robin assignment).
+
+        Calendars are queried 10 at a time and the search stops at the first chunk that has a free slot.
+        Calendars freebusy could not read are never picked; they are listed under "skipped" with the API's reasons.
+        """
+        try:
+            window_start, window_end = self._to_utc(time_min), self._to_utc(time_max)
+            duration = datetime.timedelta(minutes=duration_minutes)
+            skipped = {}
+
+            for offset in range(0, len(calendar_ids), 10):
+                chunk = calendar_ids[offset:offset + 10]
+                free_busy = orjson.loads(self.calendar_tools.query_free_busy(time_min, time_max, chunk))
+                if "error" in free_busy:
+                    return _dumps(free_busy)
+                for calendar_id, errors in free_busy["errors"].items():
+                    skipped[calendar_id] = [error.get("reason") for error in errors]
+
+                best = None
+                for calendar_id, intervals in free_busy["busy"].items():
+                    busy = sorted((self._to_utc(b["start"]), self._to_utc(b["end"])) for b in intervals)
+                    for start, end in self._free_slots(busy, window_start, window_end):
+                        if end - start >= duration:
+                            if best is None or start < best[1]:
+                                best = (calendar_id, start)
+                            break
+
+                if best is not None:
+                    calendar_id, start = best
+                    return _dumps({
+                        "found": True, "calendar_id": calendar_id, "start": start.isoformat(),
+                        "end": (start + duration).isoformat(), "calendars_checked": offset + len(chunk),
+                        "skipped": skipped
+                    })
+
+            return _dumps({"found": False, "calendars_checked": len(calendar_ids), "skipped": skipped,
+                           "error": f"No {duration_minutes}-minute slot free between {time_min} and {time_max}"})
+        except Exception as e:
+            return _dumps({"found": False, "error": f"Error finding round-robin slot: {e}"})
+
+    def _find_free_time_blocks(self, hours_needed: float, date_range: Optional[tuple] = None,
+                               working_hours: tuple = (9, 17), max_slots: int = 10,
+                               tz: Optional[str] = None) -> dict:
+        """find_free_time_blocks as a dict, for suggest_optimal_times."""
         try:
             if date_range is None:
-                start_date = datetime.date.today().isoformat()
-                end_date = (datetime.date.today() + datetime.timedelta(days=7)).isoformat()
+                today = self._today()
+                start_date = today.isoformat()
+                end_date = (today + datetime.timedelta(days=7)).isoformat()
             else:
                 start_date, end_date = date_range
 
-            # Get all scheduled items in range
-            schedule_data = self.get_schedule_range(start_date, end_date, include_tasks=True)
-            if "error" in schedule_data:
-                return schedule_data
-
-            items = json.loads(schedule_data)
-            free_blocks = []
-
             # Analyze each day
             current_date = datetime.datetime.fromisoformat(start_date).date()
             end_date_obj = datetime.datetime.fromisoformat(end_date).date()
+            if current_date > end_date_obj:
+                return {"error": "Start date must be before or equal to end date"}
+
+            # Working hours, the busy index and the returned blocks are all wall-clock times in tz
+            zone = ZoneInfo(tz) if tz else None
+            start_hour, end_hour = working_hours
+            needed = datetime.timedelta(hours=hours_needed)
+            busy_index = self._busy_index(current_date, end_date_obj, zone)
+            free_blocks = []
+            slots_left = max_slots
 
-            while current_date <= end_date_obj:
+            # Days are scanned in order, so the scan stops once max_slots blocks are collected
+            while current_date <= end_date_obj and slots_left > 0:
                 date_str = current_date.isoformat()
-                day_items = [item for item in items if date_str in item.get("time", "")]
+                midnight = datetime.datetime.combine(current_date, datetime.time())
+                day_start = midnight + datetime.timedelta(hours=start_hour)
+                day_end = midnight + datetime.timedelta(hours=end_hour)
+                noon = midnight + datetime.timedelta(hours=12)
+                intervals = busy_index.get(date_str, ((), ()))[1]
+
+                # Sweep the day's busy intervals (all-day items are usually transparent and don't block) for the gaps
+                # left inside working hours
+                gaps = self._free_slots(intervals, day_start, day_end)
+                usable = [(start, end) for start, end in gaps if end - start >= needed][:slots_left]
+
+                if usable:
+                    slots_left -= len(usable)
+                    recommended_times = []
+                    if any(start < noon for start, _ in usable):
+                        recommended_times.append("morning")
+                    if any(end - max(start, noon) >= needed for start, end in usable):
+                        recommended_times.append("afternoon")
 
-                # Simple free time detection (can be enhanced)
-                start_hour, end_hour = working_hours
-                total_work_hours = end_hour - start_hour
-                busy_hours = len([item for item in day_items if "All day" not in item.get("time", "")])
-
-                estimated_free_hours = max(0, total_work_hours - busy_hours)
-
-                if estimated_free_hours >= hours_needed:
                     free_blocks.append({
                         "date": date_str,
-                        "day_name": current_date.strftime("%A"),
-                        "estimated_free_hours": estimated_free_hours,
-                        "busy_items": len(day_items),
-                        "recommended_times": ["morning", "afternoon"] if estimated_free_hours > 4 else ["morning"]
+                        "day_name": _DAY_NAMES[current_date.weekday()],
+                        "estimated_free_hours": round(sum((end - start).total_seconds() for start, end in gaps) / 3600, 2),
+                        # time().isoformat is the C fast path for "HH:MM"; strftime re-parses its format
+                        "free_blocks": [{"start": start.time().isoformat("minutes"),
+                                         "end": end.time().isoformat("minutes")}
+                                        for start, end in usable],
+                        "busy_items": len(intervals),
+                        "recommended_times": recommended_times
                     })
 
                 current_date += datetime.timedelta(days=1)
 
-            return json.dumps({
+            return {
                 "hours_needed": hours_needed,
                 "date_range": f"{start_date} to {end_date}",
                 "free_blocks_found": len(free_blocks),
                 "recommendations": free_blocks
-            }, indent=2)
+            }
         except Exception as e:
-            return json.dumps({"error": f"Error finding free time: {e}"})
+            return {"error": f"Error finding free time: {e}"}
 
-    def suggest_optimal_times(self, task_count: int, hours_per_task: float, deadline_date: str = None) -> str:
-        """Suggest optimal scheduling for multiple tasks with deadline analysis."""
+    def find_free_time_blocks(self, hours_needed: float, date_range: Optional[tuple] = None,
+                              working_hours: tuple = (9, 17), max_slots: int = 10,
+                              tz: Optional[str] = None) -> str:
+        """Find available time blocks for scheduling - core scheduling intelligence.
+
+        working_hours and the returned block times are wall-clock hours in tz, an IANA name such as
+        "Europe/Berlin" (the system's local zone by default). Returns the earliest max_slots blocks at most; the search stops once it has them.
+        """
+        return _dumps(self._find_free_time_blocks(hours_needed, date_range, working_hours, max_slots, tz))
+
+    def suggest_optimal_times(self, task_count: int, hours_per_task: float, deadline_date: Optional[str] = None,
+                              tz: Optional[str] = None) -> str:
+        """Suggest optimal scheduling for multiple tasks with deadline analysis.
+
+        Block times are wall-clock hours in tz, as in find_free_time_blocks.
+        """
         try:
+            today = self._today()
             if deadline_date:
                 deadline = datetime.datetime.fromisoformat(deadline_date).date()
-                days_available = (deadline - datetime.date.today()).days
+                days_available = (deadline - today).days
             else:
                 days_available = 7  # Default to one week
 
@@ -526,13 +937,11 @@ class Scheduler(Toolkit):
             hours_per_day = total_hours / max(1, days_available)
 
             # Get free time blocks
-            end_date = deadline_date if deadline_date else (
-                        datetime.date.today() + datetime.timedelta(days=7)).isoformat()
-            free_blocks_result = self.find_free_time_blocks(hours_per_task,
-                                                            (datetime.date.today().isoformat(), end_date))
-            free_blocks_data = json.loads(free_blocks_result)
+            end_date = deadline_date if deadline_date else (today + datetime.timedelta(days=7)).isoformat()
+            free_blocks_data = self._find_free_time_blocks(hours_per_task, (today.isoformat(), end_date),
+                                                           max_slots=max(10, task_count), tz=tz)
 
-            return json.dumps({
+            return _dumps({
                 "analysis": {
                     "total_tasks": task_count,
                     "hours_per_task": hours_per_task,
@@ -543,9 +952,9 @@ class Scheduler(Toolkit):
                 "feasibility": "feasible" if hours_per_day <= 8 else "challenging",
                 "available_blocks": free_blocks_data.get("recommendations", []),
                 "suggestion": f"Schedule {hours_per_task}h blocks across {len(free_blocks_data.get('recommendations', []))} available days"
-            }, indent=2)
+            })
         except Exception as e:
-            return json.dumps({"error": f"Error suggesting optimal times: {e}"})
+            return _dumps({"error": f"Error suggesting optimal times: {e}"})
 
 
 if __name__ == "__main__":
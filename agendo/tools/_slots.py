@@ -0,0 +1,36 @@
+"""
+Free-slot sweep behind the Scheduler's free-time tools.
+
+Kept fully annotated and free of project imports so it can be compiled ahead of time with mypyc
+for large calendars; run from the checkout root:
+
+    pip install mypy
+    mypyc agendo/tools/_slots.py
+
+This builds an extension module next to this file that Python imports in its place. Without it
+the same code runs interpreted.
+"""
+import datetime
+from typing import List, Sequence, Tuple
+
+
+def free_slots(busy: Sequence[tuple], window_start: datetime.datetime,
+               window_end: datetime.datetime) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+    """
+    Invert busy intervals, possibly overlapping, into the free gaps of the window.
+
+    busy must be sorted by start; only the first two items of each interval, (start, end), are read.
+    """
+    free: List[Tuple[datetime.datetime, datetime.datetime]] = []
+    cursor = window_start
+    for interval in busy:
+        start: datetime.datetime = interval[0]
+        end: datetime.datetime = interval[1]
+        if start > cursor:
+            free.append((cursor, min(start, window_end)))
+        cursor = max(cursor, end)
+        if cursor >= window_end:
+            break
+    if cursor < window_end:
+        free.append((cursor, window_end))
+    return free